@@ -14,7 +14,7 @@ from binary_schema import (
     BinarySchema, BinaryField, FieldType,
     encode_schema, decode_schema,
     schema_to_base64, base64_to_schema,
-    schema_hash, compute_crc32,
+    schema_hash, compute_crc32, compile_encoder,
     OPCODE_MATCH, OPCODE_VAR,
 )
 
@@ -55,7 +55,16 @@ class TestBinaryField:
         assert field.size == 2
         assert field.mult_exponent == -2
         assert field.semantic_id == 3303
-    
+
+    def test_field_from_buffer_offset(self):
+        """Test decoding a field in place at an offset."""
+        data = bytes([0x01, 0x02, 0x12, 0xFE, 0xE7, 0x0C])
+        field = BinaryField.from_buffer(data, 2)
+
+        assert field == BinaryField.from_bytes(data[2:])
+        assert field.mult_exponent == -2
+        assert field.semantic_id == 3303
+
     def test_field_roundtrip(self):
         """Test field encode/decode roundtrip."""
         original = BinaryField(
@@ -77,6 +86,11 @@ class TestBinaryField:
         with pytest.raises(ValueError, match="Need 4 bytes"):
             BinaryField.from_bytes(bytes([0x12, 0xFE]))
 
+    def test_field_from_bytes_invalid_type(self):
+        """Test a type nibble outside FieldType is rejected."""
+        with pytest.raises(ValueError):
+            BinaryField.from_bytes(bytes([0x82, 0x00, 0x00, 0x00]))
+
 
 class TestBinarySchema:
     """Tests for BinarySchema class."""
@@ -176,6 +190,12 @@ class TestBinarySchemaEncoder:
         assert isinstance(data, bytes)
         assert len(data) >= 2  # At least header
     
+    def test_encode_with_hash(self, encoder, simple_schema):
+        """Test encoding to bytes together with the schema hash."""
+        data, crc = encoder.encode_with_hash(simple_schema)
+        assert data == encoder.encode_to_bytes(simple_schema)
+        assert crc == compute_crc32(data) == schema_hash(simple_schema)
+    
     def test_encode_to_base64(self, encoder, simple_schema):
         """Test encoding directly to base64."""
         b64 = encoder.encode_to_base64(simple_schema)
@@ -277,6 +297,20 @@ class TestBinarySchemaDecoder:
         
         assert len(schema['fields']) == 1
         assert schema['fields'][0]['type'] == 's16'
+    
+    def test_decode_from_bytes_matches_decode(self, decoder):
+        """Test the v1 bytes path gives the same result as decode()."""
+        data = bytes([
+            0x01, 0x03,
+            0x12, 0xFE, 0xE7, 0x0C,
+            0x01, 0xFF, 0x00, 0x00,
+            0x24, 0x00, 0xE8, 0x0C,
+        ])
+        expected = decoder.decode(BinarySchema.from_bytes(data))
+        assert decoder.decode_from_bytes(data) == expected
+        
+        with pytest.raises(ValueError, match="Truncated"):
+            decoder.decode_from_bytes(data[:-1])
 
 
 class TestConvenienceFunctions:
@@ -332,6 +366,17 @@ class TestConvenienceFunctions:
         assert isinstance(crc, int)
         assert 0 <= crc <= 0xFFFFFFFF
 
+    def test_compile_encoder(self, test_schema):
+        """Test compiled encoders match encode_schema at compile time."""
+        schema = dict(test_schema, fields=list(test_schema['fields']))
+        encoder = compile_encoder(schema)
+        expected = encode_schema(schema)
+        assert encoder() == expected
+
+        schema['fields'].pop()
+        assert encoder() == expected
+        assert compile_encoder(schema)() == encode_schema(schema) != expected
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
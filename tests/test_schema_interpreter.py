@@ -1788,7 +1788,25 @@ class TestDeclarativeComputedFields:
         result = interpreter.decode(bytes([3]))
         assert result.success
         assert result.data['y'] == 4.0
-    
+
+    def test_ref_reused_across_decodes(self):
+        """Test refs resolve per payload when the interpreter is reused."""
+        schema = {
+            'fields': [
+                {'name': 'x', 'type': 'u8'},
+                {'name': 'y', 'type': 'number',
+                 'ref': '$x',
+                 'polynomial': [1, -2, 1]},
+                {'name': 'offset', 'type': 'number', 'ref': 2.5, 'mult': 2},
+            ]
+        }
+        interpreter = SchemaInterpreter(schema)
+
+        assert interpreter.decode(bytes([3])).data['y'] == 4.0
+        result = interpreter.decode(bytes([5]))
+        assert result.data['y'] == 16.0
+        assert result.data['offset'] == 5.0
+
     def test_compute_division(self):
         """Test compute with division operation."""
         schema = {
@@ -3149,6 +3167,30 @@ class TestEncoderEdgeCases:
         # Should either error or produce a warning
         assert not result.success or len(result.warnings) > 0 or len(result.errors) > 0
 
+    def test_encode_fixed_layout_with_padding(self):
+        """Fixed-width fields and skip padding pack into one buffer."""
+        schema = {'endian': 'little', 'fields': [
+            {'name': 'a', 'type': 'u16'},
+            {'type': 'skip', 'length': 2},
+            {'name': 'b', 'type': 's8'},
+            {'name': 'c', 'type': 'f32', 'mult': 0.5},
+        ]}
+        interpreter = SchemaInterpreter(schema)
+        result = interpreter.encode({'a': 0x1234, 'b': -2, 'c': 1.5})
+        assert result.payload == bytes([0x34, 0x12, 0, 0, 0xFE]) + struct.pack('<f', 3.0)
+        assert interpreter.decode(result.payload).data == {'a': 0x1234, 'b': -2, 'c': 1.5}
+
+    def test_encode_fixed_layout_drops_failed_field(self):
+        """A field that fails to encode is omitted from the payload."""
+        schema = {'fields': [
+            {'name': 'a', 'type': 'u8'},
+            {'name': 'b', 'type': 'u8'},
+            {'name': 'c', 'type': 'u8'},
+        ]}
+        result = SchemaInterpreter(schema).encode({'a': 1, 'b': 300, 'c': 3})
+        assert result.payload == bytes([1, 3])
+        assert len(result.errors) == 1
+
 
 class TestMatchEdgeCases:
     """Edge cases for match conditional."""
@@ -3721,6 +3763,22 @@ class TestLookupModifier:
         # Should return raw value or unknown marker
         assert '153' in str(result.data['status']) or result.data['status'] == 153
 
+    def test_lookup_sparse_dict(self):
+        """Sparse integer keys map by key, gaps pass the raw value through."""
+        schema = {
+            'fields': [{
+                'name': 'state',
+                'type': 'u8',
+                'lookup': {0: 'off', 4: 'fault', 10: 'boot'}
+            }]
+        }
+        interp = SchemaInterpreter(schema)
+
+        assert interp.decode(bytes([10])).data['state'] == 'boot'
+        assert interp.decode(bytes([4])).data['state'] == 'fault'
+        assert interp.decode(bytes([2])).data['state'] == 2
+        assert interp.decode(bytes([200])).data['state'] == 200
+
 
 class TestTransformOperations:
     """
@@ -3792,6 +3850,23 @@ class TestBitfieldString:
         assert result.success
         assert result.data['version'] == 'v1.2.3'
 
+    def test_bitfield_string_little_endian(self):
+        """Little-endian bitfield_string reads parts from the swapped word."""
+        schema = {
+            'endian': 'little',
+            'fields': [{
+                'name': 'version',
+                'type': 'bitfield_string',
+                'length': 2,
+                'parts': [[12, 4], [8, 4], [0, 8]]
+            }]
+        }
+        interp = SchemaInterpreter(schema)
+        # 0x12 0x03 little endian = 0x0312 -> major=0, minor=3, patch=0x12
+        result = interp.decode(bytes([0x12, 0x03]))
+        assert result.success
+        assert result.data['version'] == '0.3.18'
+
 
 class TestByteGroup:
     """
@@ -3896,6 +3971,22 @@ class TestSkipType:
         assert result.data['b'] == 2
         assert '_pad' not in result.data  # Skip should not appear in output
 
+    def test_skip_consecutive_and_named(self):
+        """Adjacent skips (internal or named) advance without output."""
+        schema = {
+            'fields': [
+                {'name': 'a', 'type': 'u8'},
+                {'name': '_pad', 'type': 'skip', 'length': 2},
+                {'name': 'reserved', 'type': 'skip'},
+                {'name': 'b', 'type': 'u8'}
+            ]
+        }
+        interp = SchemaInterpreter(schema)
+        result = interp.decode(bytes([0x01, 0xFF, 0xFF, 0xFF, 0x02]))
+        assert result.success
+        assert result.data == {'a': 1, 'b': 2}
+        assert result.bytes_consumed == 5
+
 
 class TestEndian:
     """
@@ -4071,6 +4162,19 @@ class TestVariablesComprehensive:
         assert result.data['raw'] == 25
         assert result.data['doubled'] == 50
 
+    def test_var_in_formula_rebinds_per_decode(self):
+        """Compiled formula sees each decode's values, including negatives."""
+        schema = {
+            'fields': [
+                {'name': 'raw', 'type': 's8', 'var': 'r'},
+                {'name': 'squared', 'type': 'number', 'formula': '$r ** 2'}
+            ]
+        }
+        interp = SchemaInterpreter(schema)
+        assert interp.decode(bytes([3])).data['squared'] == 9
+        # -5 is bound as a value, not spliced in as text ("-5 ** 2" == -25)
+        assert interp.decode(bytes([0xFB])).data['squared'] == 25
+
     def test_var_in_compute(self):
         """Variable used in compute."""
         schema = {
@@ -4438,6 +4542,105 @@ class TestRepeatType:
         assert not result.success
         assert 'must specify' in str(result.errors[0]).lower()
 
+    def test_repeat_packed_element_little_endian_with_skip(self):
+        """Fixed-width numeric elements decode via one packed read per element."""
+        schema = {
+            'endian': 'little',
+            'fields': [
+                {
+                    'name': 'readings',
+                    'type': 'repeat',
+                    'count': 2,
+                    'fields': [
+                        {'name': 'temp', 'type': 's16', 'div': 10},
+                        {'name': '_pad', 'type': 'skip', 'length': 1},
+                        {'name': 'level', 'type': 'f32'},
+                    ]
+                }
+            ]
+        }
+        interp = SchemaInterpreter(schema)
+        payload = (struct.pack('<hxf', -55, 1.5) + struct.pack('<hxf', 231, -2.0))
+        result = interp.decode(payload)
+
+        assert result.success
+        assert result.data['readings'] == [
+            {'temp': -5.5, 'level': 1.5},
+            {'temp': 23.1, 'level': -2.0},
+        ]
+        # Second decode reuses the compiled element layout
+        assert interp.decode(payload).data == result.data
+
+    def test_repeat_packed_element_truncated(self):
+        """A truncated trailing element still reports a short-buffer error."""
+        schema = {
+            'fields': [
+                {
+                    'name': 'items',
+                    'type': 'repeat',
+                    'until': 'end',
+                    'fields': [{'name': 'v', 'type': 'u16'}]
+                }
+            ]
+        }
+        interp = SchemaInterpreter(schema)
+        result = interp.decode(bytes([0x00, 0x01, 0x00]))
+
+        assert not result.success
+        assert 'too short' in str(result.errors[0]).lower()
+
+
+class TestDecodeMany:
+    """Tests for batch decoding with decode_many()."""
+
+    SCHEMA = {
+        'endian': 'big',
+        'fields': [
+            {'name': 'temp', 'type': 's16', 'mult': 0.1},
+            {'type': 'skip', 'length': 1},
+            {'name': '_rsv', 'type': 'u8'},
+            {'name': 'mode', 'type': 'u8', 'lookup': ['off', 'on']},
+        ]
+    }
+
+    def test_decode_many_matches_decode(self):
+        """Fixed-layout batch results equal per-payload decode()."""
+        interp = SchemaInterpreter(self.SCHEMA)
+        payloads = [bytes([0x00, 0xE7, 0, 9, 1]), bytes([0xFF, 0xC9, 0, 9, 0])]
+        results = interp.decode_many(payloads)
+
+        assert [r.data for r in results] == [interp.decode(p).data for p in payloads]
+        assert results[0].data == {'temp': 23.1, 'mode': 'on'}
+        assert results[1].bytes_consumed == 5
+
+    def test_decode_many_concatenated_buffer(self):
+        """record_size splits one buffer into records."""
+        interp = SchemaInterpreter(self.SCHEMA)
+        results = interp.decode_many(bytes([0x00, 0x0A, 0, 0, 0] * 3), record_size=5)
+
+        assert len(results) == 3
+        assert all(r.data == {'temp': 1.0, 'mode': 'off'} for r in results)
+
+    def test_decode_many_short_payload(self):
+        """A truncated payload reports the same error as decode()."""
+        interp = SchemaInterpreter(self.SCHEMA)
+        results = interp.decode_many([bytes([0x00, 0x0A])])
+
+        assert not results[0].success
+        assert results[0].errors == interp.decode(bytes([0x00, 0x0A])).errors
+
+    def test_decode_many_variable_layout(self):
+        """Schemas without a fixed layout fall back to decode()."""
+        schema = {'fields': [
+            {'name': 'n', 'type': 'u8'},
+            {'name': 'items', 'type': 'repeat', 'count': '$n',
+             'fields': [{'name': 'v', 'type': 'u8'}]},
+        ]}
+        interp = SchemaInterpreter(schema)
+        results = interp.decode_many([bytes([1, 7]), bytes([2, 7, 8])])
+
+        assert results[1].data == {'n': 2, 'items': [{'v': 7}, {'v': 8}]}
+
 
 class TestEdgeCasesAndSecurity:
     """Tests for edge cases, malformed inputs, and security boundaries."""
@@ -0,0 +1,51 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_native_decode.pyx - Cython port of benchmark_all.native_decode
+
+Optional "Native (Cython)" row for the DL-5TM benchmark; benchmark_all.py
+leaves the row out when this module is not built.
+
+Build (in place, next to benchmark_all.py):
+    pip install cython
+    cythonize -i tools/_native_decode.pyx
+"""
+
+
+cdef inline unsigned int _u16(const unsigned char[::1] data, Py_ssize_t pos):
+    return (data[pos] << 8) | data[pos + 1]
+
+
+cpdef object native_decode_c(const unsigned char[::1] data, make):
+    """native_decode with the byte and float arithmetic in C.
+    
+    make builds the result from the 8 values (pass DL5TMResult._make, so
+    the result matches native_decode); returns None when the payload is
+    shorter than the 5-byte header.
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef Py_ssize_t pos = 5
+    cdef unsigned int flags, raw
+    cdef double d
+
+    if n < 5:
+        return None
+
+    flags = _u16(data, 3)
+    dielectric = vwc = raw_temp = soil_temperature = battery = None
+
+    # Sensor group 0 (bit 0)
+    if flags & 1 and pos + 4 <= n:
+        d = _u16(data, pos) / 50.0
+        dielectric = d
+        vwc = ((0.0000043 * d - 0.00055) * d + 0.0292) * d - 0.053
+        raw = _u16(data, pos + 2)
+        raw_temp = raw
+        soil_temperature = (<int>raw - 400) / 10.0
+        pos += 4
+
+    # Sensor group 1 (bit 1)
+    if flags & 2 and pos + 2 <= n:
+        battery = _u16(data, pos) / 1000.0
+
+    return make((data[0], _u16(data, 1), flags, dielectric, vwc,
+                 raw_temp, soil_temperature, battery))
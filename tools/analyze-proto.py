@@ -18,13 +18,18 @@ Output: Markdown report with optional PDF generation
 """
 
 import argparse
+import heapq
+import io
 import json
 import re
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
-from typing import Any
+from itertools import islice, repeat
+from typing import Any, NamedTuple
 
 # Protobuf wire type sizes (in bytes): (min, typical, max)
 WIRE_SIZES = {
@@ -52,6 +57,84 @@ WIRE_SIZES = {
     'message': (2, 50, 500),
 }
 
+# Repeated fields of these types are flagged as candidates for packed encoding
+_PACKABLE_NUMERIC_TYPES = frozenset(['uint32', 'uint64', 'int32', 'int64'])
+
+# Report category for each scalar proto type
+_TYPE_CATEGORY = {
+    'int32': 'integer', 'int64': 'integer',
+    'uint32': 'integer', 'uint64': 'integer',
+    'sint32': 'integer', 'sint64': 'integer',
+    'fixed32': 'fixed', 'fixed64': 'fixed',
+    'sfixed32': 'fixed', 'sfixed64': 'fixed',
+    'float': 'float', 'double': 'float',
+    'bool': 'boolean',
+    'string': 'string',
+    'bytes': 'bytes',
+}
+
+# Plain (no modifier) scalar field sizes: wire size plus a 1-byte tag
+_PLAIN_FIELD_SIZES = {
+    name: (1 + min_s, 1 + typ_s, 1 + max_s)
+    for name, (min_s, typ_s, max_s) in WIRE_SIZES.items()
+}
+
+# Several input files totalling at least this many characters are parsed
+# in worker processes; below it, process startup costs more than it saves
+PARALLEL_PARSE_MIN_SIZE = 1_000_000
+
+# Proto grammar patterns, compiled once at import
+# File-level declarations in one alternation; m.lastgroup names the kind
+# (enum bodies end on 'enum_body')
+_DECL_RE = re.compile(
+    r'syntax\s*=\s*"(?P<syntax>proto[23])"\s*;'
+    r'|package\s+(?P<package>\w+);'
+    r'|import\s+"(?P<import>[^"]+)"\s*;'
+    r'|enum\s+(?P<enum>\w+)\s*\{(?P<enum_body>[^}]+)\}'
+    r'|message\s+(?P<message>\w+)\s*\{'
+)
+_SYNTAX_RE = re.compile(r'syntax\s*=\s*"(proto[23])"\s*;')
+# Enum values at the start of a line ([^\S\n] is whitespace within the line)
+_ENUM_VALUE_RE = re.compile(r'^[^\S\n]*(\w+)[^\S\n]*=[^\S\n]*(\d+)', re.MULTILINE)
+# Anchored at a word boundary: a failed attempt inside a long word or
+# whitespace run then costs O(1) instead of rescanning it from every offset
+_FIELD_RE = re.compile(
+    r'\b(?:(optional|repeated|required)\s+)?'
+    r'(\w+)\s+(\w+)\s*=\s*(\d+)\s*;'
+    r'(?:\s*//(.*))?',
+    re.MULTILINE
+)
+_ONEOF_RE = re.compile(r'oneof\s+(\w+)\s*\{([^}]+)\}', re.DOTALL)
+_SPEC_MSG_RE = re.compile(r'message\s+(\w+)\s*\{?', re.MULTILINE)
+
+
+class ProtoField(NamedTuple):
+    """A parsed message field, kept as a compact record rather than a dict."""
+    modifier: str
+    type: str
+    name: str
+    number: int
+    comment: str
+    
+    @property
+    def is_repeated(self) -> bool:
+        return self.modifier == 'repeated'
+    
+    @property
+    def is_optional(self) -> bool:
+        return self.modifier == 'optional'
+
+
+def _proto_field(match: re.Match) -> ProtoField:
+    """Build a ProtoField from a _FIELD_RE match."""
+    return ProtoField(
+        modifier=match.group(1) or '',
+        type=sys.intern(match.group(2)),
+        name=match.group(3),
+        number=int(match.group(4)),
+        comment=(match.group(5) or '').strip(),
+    )
+
 
 def log_info(msg: str) -> None:
     print(f"[INFO] {msg}", file=sys.stderr)
@@ -61,8 +144,35 @@ def log_warn(msg: str) -> None:
     print(f"[WARN] {msg}", file=sys.stderr)
 
 
-def parse_proto_file(content: str) -> dict:
-    """Parse proto file and extract structure."""
+def _find_matching_brace(s: str, start: int) -> int:
+    """Find the '}' closing a block whose body starts at start.
+    
+    Jumps between braces with str.find rather than stepping through every
+    character. Braces inside strings and comments are counted like any
+    other. Returns len(s) if the block is never closed.
+    """
+    depth = 1
+    next_open = s.find('{', start)
+    next_close = s.find('}', start)
+    while next_close >= 0:
+        if 0 <= next_open < next_close:
+            depth += 1
+            next_open = s.find('{', next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close
+            next_close = s.find('}', next_close + 1)
+    return len(s)
+
+
+def parse_proto_file(content: str, level: str = 'full') -> dict:
+    """Parse proto file and extract structure.
+    
+    level='summary' only counts each message's fields, leaving the
+    per-field data ('fields', 'oneofs', 'repeated_numerics',
+    'high_number_fields') empty; that is all the --json output needs.
+    """
     result = {
         'package': None,
         'messages': {},
@@ -71,115 +181,116 @@ def parse_proto_file(content: str) -> dict:
         'syntax': 'proto3',
     }
     
-    # Extract syntax
-    syntax_match = re.search(r'syntax\s*=\s*"(proto[23])"\s*;', content)
-    if syntax_match:
-        result['syntax'] = syntax_match.group(1)
-    
-    # Extract package
-    pkg_match = re.search(r'package\s+(\w+);', content)
-    if pkg_match:
-        result['package'] = pkg_match.group(1)
-    
-    # Extract imports
-    for match in re.finditer(r'import\s+"([^"]+)"\s*;', content):
-        result['imports'].append(match.group(1))
-    
-    # Extract enums (including nested)
-    enum_pattern = re.compile(
-        r'enum\s+(\w+)\s*\{([^}]+)\}',
-        re.MULTILINE | re.DOTALL
-    )
-    for match in enum_pattern.finditer(content):
-        enum_name = match.group(1)
-        enum_body = match.group(2)
-        values = []
-        for line in enum_body.split('\n'):
-            val_match = re.match(r'\s*(\w+)\s*=\s*(\d+)', line)
-            if val_match:
-                values.append({
-                    'name': val_match.group(1),
-                    'number': int(val_match.group(2)),
-                })
-        result['enums'][enum_name] = values
-    
-    # Extract messages
-    msg_pattern = re.compile(r'message\s+(\w+)\s*\{', re.MULTILINE)
-    
-    for match in msg_pattern.finditer(content):
-        msg_name = match.group(1)
+    # One sweep over the file for syntax, package, imports, enums
+    # (including nested) and message headers
+    syntax_seen = False
+    for match in _DECL_RE.finditer(content):
+        kind = match.lastgroup
+        
+        if kind == 'syntax':
+            if not syntax_seen:
+                result['syntax'] = match.group('syntax')
+                syntax_seen = True
+            continue
+        
+        if kind == 'package':
+            if result['package'] is None:
+                result['package'] = match.group('package')
+            continue
+        
+        if kind == 'import':
+            result['imports'].append(match.group('import'))
+            continue
+        
+        if kind == 'enum_body':
+            result['enums'][match.group('enum')] = [
+                {'name': name, 'number': int(number)}
+                for name, number in _ENUM_VALUE_RE.findall(match.group('enum_body'))
+            ]
+            continue
+        
+        # Message: body runs to the matching closing brace
+        msg_name = match.group('message')
         start = match.end()
         
-        # Find matching closing brace
-        depth = 1
-        pos = start
-        while depth > 0 and pos < len(content):
-            if content[pos] == '{':
-                depth += 1
-            elif content[pos] == '}':
-                depth -= 1
-            pos += 1
+        msg_body = content[start:_find_matching_brace(content, start)]
         
-        msg_body = content[start:pos-1]
+        if level == 'summary':
+            result['messages'][msg_name] = {
+                'fields': [],
+                'oneofs': {},
+                'field_count': len(_FIELD_RE.findall(msg_body)),
+                'repeated_numerics': [],
+                'high_number_fields': 0,
+            }
+            continue
         
         # Extract fields
-        fields = []
-        field_pattern = re.compile(
-            r'(?:(optional|repeated|required)\s+)?'
-            r'(\w+)\s+(\w+)\s*=\s*(\d+)\s*;'
-            r'(?:\s*//(.*))?',
-            re.MULTILINE
-        )
+        field_matches = list(_FIELD_RE.finditer(msg_body))
+        fields = [_proto_field(m) for m in field_matches]
         
-        for field_match in field_pattern.finditer(msg_body):
-            modifier = field_match.group(1) or ''
-            field_type = field_match.group(2)
-            field_name = field_match.group(3)
-            field_num = int(field_match.group(4))
-            comment = (field_match.group(5) or '').strip()
-            
-            fields.append({
-                'modifier': modifier,
-                'type': field_type,
-                'name': field_name,
-                'number': field_num,
-                'comment': comment,
-                'is_repeated': modifier == 'repeated',
-                'is_optional': modifier == 'optional',
-            })
-        
-        # Check for oneof
-        oneof_pattern = re.compile(r'oneof\s+(\w+)\s*\{([^}]+)\}', re.DOTALL)
+        # Check for oneof: its fields are the ones already matched inside
+        # its body, found by position rather than by scanning it again
         oneofs = {}
-        for oneof_match in oneof_pattern.finditer(msg_body):
-            oneof_name = oneof_match.group(1)
-            oneof_body = oneof_match.group(2)
-            oneof_fields = []
-            for field_match in field_pattern.finditer(oneof_body):
-                oneof_fields.append({
-                    'type': field_match.group(2),
-                    'name': field_match.group(3),
-                    'number': int(field_match.group(4)),
-                })
-            oneofs[oneof_name] = oneof_fields
+        field_starts = [m.start() for m in field_matches]
+        for oneof_match in _ONEOF_RE.finditer(msg_body):
+            body_start, body_end = oneof_match.span(2)
+            oneofs[oneof_match.group(1)] = fields[
+                bisect_left(field_starts, body_start):bisect_left(field_starts, body_end)
+            ]
         
         result['messages'][msg_name] = {
             'fields': fields,
             'oneofs': oneofs,
             'field_count': len(fields),
+            # Recommendation inputs, gathered while the fields are at hand
+            'repeated_numerics': [
+                f.name for f in fields
+                if f.is_repeated and f.type in _PACKABLE_NUMERIC_TYPES
+            ],
+            'high_number_fields': sum(1 for f in fields if f.number > 15),
         }
     
     return result
 
 
+def parse_proto_files(contents: list, level: str = 'full') -> dict:
+    """Parse several proto files in worker processes and merge the results.
+    
+    Merges like parsing the concatenated files: the first declared syntax
+    and package win, imports append, and later messages and enums
+    replace same-named earlier ones.
+    """
+    with ProcessPoolExecutor() as executor:
+        parsed_list = list(executor.map(parse_proto_file, contents, repeat(level)))
+    
+    merged = {
+        'package': None,
+        'messages': {},
+        'enums': {},
+        'imports': [],
+        'syntax': 'proto3',
+    }
+    syntax_seen = False
+    for content, parsed in zip(contents, parsed_list):
+        if not syntax_seen and _SYNTAX_RE.search(content):
+            merged['syntax'] = parsed['syntax']
+            syntax_seen = True
+        if merged['package'] is None:
+            merged['package'] = parsed['package']
+        merged['imports'].extend(parsed['imports'])
+        merged['enums'].update(parsed['enums'])
+        merged['messages'].update(parsed['messages'])
+    
+    return merged
+
+
 def extract_spec_messages(spec_content: str) -> set:
     """Extract message names mentioned in spec documentation."""
     messages = set()
     
-    # Pattern for message definitions in spec (protobuf-like blocks)
-    msg_pattern = re.compile(r'message\s+(\w+)\s*\{?', re.MULTILINE)
-    
-    for match in msg_pattern.finditer(spec_content):
+    # Message definitions in spec (protobuf-like blocks)
+    for match in _SPEC_MSG_RE.finditer(spec_content):
         msg_name = match.group(1)
         # Filter out common words that might match
         if len(msg_name) > 2 and msg_name[0].isupper():
@@ -188,41 +299,69 @@ def extract_spec_messages(spec_content: str) -> set:
     return messages
 
 
-def estimate_size(field_type: str, modifier: str, messages: dict) -> tuple:
-    """Estimate min/typical/max size for a field."""
-    base_type = field_type.lower()
+def estimate_size(field_type: str, modifier: str, messages: dict,
+                  cache: dict = None) -> tuple:
+    """Estimate min/typical/max size for a field.
+    
+    cache memoizes results across calls: (field_type, modifier) keys hold
+    scalar field estimates and message-name keys hold message totals,
+    filled bottom-up by estimate_message_sizes() on the first miss.
+    """
+    # Fast path: a plain scalar field is its wire size plus a 1-byte tag
+    if not modifier:
+        size = _PLAIN_FIELD_SIZES.get(field_type)
+        if size is not None:
+            return size
+    
+    if cache is None:
+        cache = {}
+    key = (field_type, modifier)
+    if key in cache:
+        return cache[key]
+    
+    # Proto scalars are lowercase already; only other names pay for lower()
+    base_type = field_type if field_type in WIRE_SIZES else field_type.lower()
     tag_size = 1  # Most fields have number < 16
     
-    if base_type in WIRE_SIZES:
-        min_s, typ_s, max_s = WIRE_SIZES[base_type]
+    wire_sizes = WIRE_SIZES.get(base_type)
+    if wire_sizes is not None:
+        min_s, typ_s, max_s = wire_sizes
     elif field_type in messages:
-        nested = messages[field_type]
-        min_s, typ_s, max_s = estimate_message_size(nested, messages)
+        if field_type not in cache:
+            estimate_message_sizes(messages, cache)
+        min_s, typ_s, max_s = cache[field_type]
         min_s += 1
         typ_s += 1
         max_s += 2
+        key = None  # Depends on the cached total, not cached itself
     else:
         min_s, typ_s, max_s = 1, 2, 4
     
     if modifier == 'repeated':
-        return (0, (tag_size + typ_s) * 3, (tag_size + max_s) * 10)
+        size = (0, (tag_size + typ_s) * 3, (tag_size + max_s) * 10)
     elif modifier == 'optional':
-        return (0, tag_size + typ_s, tag_size + max_s)
+        size = (0, tag_size + typ_s, tag_size + max_s)
     else:
-        return (tag_size + min_s, tag_size + typ_s, tag_size + max_s)
+        size = (tag_size + min_s, tag_size + typ_s, tag_size + max_s)
+    if key is not None:
+        cache[key] = size
+    return size
 
 
-def estimate_message_size(msg: dict, all_messages: dict) -> tuple:
+def estimate_message_size(msg: dict, all_messages: dict, cache: dict = None) -> tuple:
     """Estimate total message size."""
+    if cache is None:
+        cache = {}
     min_total = 0
     typ_total = 0
     max_total = 0
     
     for field in msg.get('fields', []):
         min_s, typ_s, max_s = estimate_size(
-            field['type'], 
-            field['modifier'],
-            all_messages
+            field.type,
+            field.modifier,
+            all_messages,
+            cache,
         )
         min_total += min_s
         typ_total += typ_s
@@ -231,26 +370,63 @@ def estimate_message_size(msg: dict, all_messages: dict) -> tuple:
     return (min_total, typ_total, max_total)
 
 
+def estimate_message_sizes(messages: dict, cache: dict = None) -> dict:
+    """Estimate every message's total size in one bottom-up sweep.
+    
+    Walks the embedding graph depth-first with an explicit stack, so each
+    message is sized after the messages it embeds and deep nesting cannot
+    hit the recursion limit. A field referring back to a message still
+    being sized (a recursive type) counts as a generic 'message' field.
+    Returns cache with each message name mapped to (min, typical, max).
+    """
+    if cache is None:
+        cache = {}
+    
+    def embedded(name):
+        return [
+            f.type for f in messages[name].get('fields', [])
+            if f.type in messages and f.type.lower() not in WIRE_SIZES
+        ]
+    
+    for root in messages:
+        if root in cache:
+            continue
+        children = embedded(root)
+        stack = [(root, children, iter(children))]
+        in_progress = {root}
+        while stack:
+            name, children, remaining = stack[-1]
+            for child in remaining:
+                if child not in cache and child not in in_progress:
+                    grandchildren = embedded(child)
+                    stack.append((child, grandchildren, iter(grandchildren)))
+                    in_progress.add(child)
+                    break
+            else:
+                # Embedded messages are sized; back-references get a placeholder
+                back_refs = {c for c in children if c in in_progress and c not in cache}
+                for child in back_refs:
+                    cache[child] = WIRE_SIZES['message']
+                size = estimate_message_size(messages[name], messages, cache)
+                for child in back_refs:
+                    del cache[child]
+                cache[name] = size
+                stack.pop()
+                in_progress.discard(name)
+    
+    return cache
+
+
 def categorize_field_type(field_type: str, enums: dict, messages: dict) -> str:
     """Categorize a field type."""
-    if field_type in ['int32', 'int64', 'uint32', 'uint64', 'sint32', 'sint64']:
-        return 'integer'
-    elif field_type in ['fixed32', 'fixed64', 'sfixed32', 'sfixed64']:
-        return 'fixed'
-    elif field_type in ['float', 'double']:
-        return 'float'
-    elif field_type == 'bool':
-        return 'boolean'
-    elif field_type == 'string':
-        return 'string'
-    elif field_type == 'bytes':
-        return 'bytes'
-    elif field_type in enums:
+    category = _TYPE_CATEGORY.get(field_type)
+    if category:
+        return category
+    if field_type in enums:
         return 'enum'
-    elif field_type in messages:
+    if field_type in messages:
         return 'message'
-    else:
-        return 'other'
+    return 'other'
 
 
 def analyze_spec_coverage(proto_messages: dict, proto_enums: dict, 
@@ -268,29 +444,57 @@ def analyze_spec_coverage(proto_messages: dict, proto_enums: dict,
     }
 
 
+def _enum_range(values: list) -> str:
+    """Format an enum's value range for the report."""
+    if not values:
+        return "empty"
+    numbers = [v['number'] for v in values]
+    return f"{min(numbers)}-{max(numbers)}"
+
+
+def _write_lines(out, rows) -> None:
+    """Write each row to out as its own line."""
+    for row in rows:
+        out.write(row)
+        out.write('\n')
+
+
 def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
                     output_dir: Path = None) -> str:
     """Generate comprehensive analysis report."""
-    lines = []
+    out = io.StringIO()
     messages = parsed['messages']
     enums = parsed['enums']
     
-    # Calculate sizes
+    # Calculate sizes, gathering the summary statistics in the same pass
     size_data = []
+    message_sizes = estimate_message_sizes(messages)
+    field_total = 0
+    typ_sum = 0
+    typ_min = typ_max = None
     for msg_name, msg in sorted(messages.items()):
-        min_s, typ_s, max_s = estimate_message_size(msg, messages)
+        min_s, typ_s, max_s = message_sizes[msg_name]
         size_data.append((msg_name, msg['field_count'], min_s, typ_s, max_s))
-    
-    # Field type distribution
-    type_counts = defaultdict(int)
+        field_total += msg['field_count']
+        typ_sum += typ_s
+        if typ_min is None or typ_s < typ_min:
+            typ_min = typ_s
+        if typ_max is None or typ_s > typ_max:
+            typ_max = typ_s
+    msg_count = len(size_data)
+    avg_typ = typ_sum // msg_count if msg_count else 0
+    
+    # Field type distribution: count each type, then categorize it once
+    type_usage = Counter()
     for msg in messages.values():
-        for field in msg.get('fields', []):
-            category = categorize_field_type(field['type'], enums, messages)
-            type_counts[category] += 1
+        type_usage.update(field.type for field in msg.get('fields', []))
+    type_counts = Counter()
+    for field_type, count in type_usage.items():
+        type_counts[categorize_field_type(field_type, enums, messages)] += count
     total_fields = sum(type_counts.values())
     
     # Header
-    lines.extend([
+    _write_lines(out, [
         "# Protocol Buffer Analysis Report",
         "",
         f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
@@ -306,7 +510,7 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         "|--------|-------|",
         f"| Messages | {len(messages)} |",
         f"| Enums | {len(enums)} |",
-        f"| Total Fields | {sum(m['field_count'] for m in messages.values())} |",
+        f"| Total Fields | {field_total} |",
         f"| Imports | {len(parsed['imports'])} |",
         "",
     ])
@@ -316,7 +520,7 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         spec_messages = extract_spec_messages(spec_content)
         coverage = analyze_spec_coverage(messages, enums, spec_messages)
         
-        lines.extend([
+        _write_lines(out, [
             "### Spec Coverage",
             "",
             f"| Metric | Value |",
@@ -329,18 +533,17 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         ])
         
         if coverage['proto_only']:
-            lines.extend([
+            _write_lines(out, [
                 "**Undocumented messages:**",
                 "",
             ])
-            for msg in coverage['proto_only'][:10]:
-                lines.append(f"- `{msg}`")
+            _write_lines(out, (f"- `{msg}`" for msg in coverage['proto_only'][:10]))
             if len(coverage['proto_only']) > 10:
-                lines.append(f"- ... and {len(coverage['proto_only']) - 10} more")
-            lines.append("")
+                print(f"- ... and {len(coverage['proto_only']) - 10} more", file=out)
+            print(file=out)
     
     # Message Size Analysis
-    lines.extend([
+    _write_lines(out, [
         "---",
         "",
         "## Message Size Analysis",
@@ -351,25 +554,27 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         "|---------|--------|-----|---------|-----|",
     ])
     
-    for name, fields, min_s, typ_s, max_s in sorted(size_data, key=lambda x: -x[3])[:20]:
-        lines.append(f"| `{name}` | {fields} | {min_s} | {typ_s} | {max_s} |")
+    _write_lines(out, (
+        f"| `{name}` | {fields} | {min_s} | {typ_s} | {max_s} |"
+        for name, fields, min_s, typ_s, max_s in heapq.nsmallest(20, size_data, key=lambda x: -x[3])
+    ))
     
-    if len(size_data) > 20:
-        lines.append(f"| ... | | | | |")
-        lines.append(f"| *({len(size_data) - 20} more messages)* | | | | |")
+    if msg_count > 20:
+        print(f"| ... | | | | |", file=out)
+        print(f"| *({msg_count - 20} more messages)* | | | | |", file=out)
     
-    lines.extend([
+    _write_lines(out, [
         "",
         "### Size Statistics",
         "",
-        f"- **Average typical size:** {sum(s[3] for s in size_data) // len(size_data) if size_data else 0} bytes",
-        f"- **Smallest:** {min(s[3] for s in size_data) if size_data else 0} bytes",
-        f"- **Largest:** {max(s[3] for s in size_data) if size_data else 0} bytes",
+        f"- **Average typical size:** {avg_typ} bytes",
+        f"- **Smallest:** {typ_min or 0} bytes",
+        f"- **Largest:** {typ_max or 0} bytes",
         "",
     ])
     
     # Field Type Distribution
-    lines.extend([
+    _write_lines(out, [
         "---",
         "",
         "## Field Type Distribution",
@@ -378,14 +583,15 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         "|------|-------|------------|",
     ])
     
-    for cat, count in sorted(type_counts.items(), key=lambda x: -x[1]):
-        pct = count / total_fields * 100 if total_fields else 0
-        lines.append(f"| {cat.title()} | {count} | {pct:.1f}% |")
+    _write_lines(out, (
+        f"| {cat.title()} | {count} | {(count / total_fields * 100 if total_fields else 0):.1f}% |"
+        for cat, count in sorted(type_counts.items(), key=lambda x: -x[1])
+    ))
     
-    lines.append("")
+    print(file=out)
     
     # Enum Analysis
-    lines.extend([
+    _write_lines(out, [
         "---",
         "",
         "## Enum Analysis",
@@ -394,19 +600,16 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         "|------|--------|-------|",
     ])
     
-    for enum_name, values in sorted(enums.items()):
-        if values:
-            numbers = [v['number'] for v in values]
-            range_str = f"{min(numbers)}-{max(numbers)}"
-        else:
-            range_str = "empty"
-        lines.append(f"| `{enum_name}` | {len(values)} | {range_str} |")
+    _write_lines(out, (
+        f"| `{enum_name}` | {len(values)} | {_enum_range(values)} |"
+        for enum_name, values in sorted(enums.items())
+    ))
     
-    lines.append("")
+    print(file=out)
     
     # Bandwidth Analysis
-    avg_size = sum(s[3] for s in size_data) // len(size_data) if size_data else 50
-    lines.extend([
+    avg_size = avg_typ if msg_count else 50
+    _write_lines(out, [
         "---",
         "",
         "## Bandwidth Estimates",
@@ -419,10 +622,10 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         bw = avg_size * rate * 8 / 1000
         unit = "kbps" if bw < 1000 else "Mbps"
         val = bw if bw < 1000 else bw / 1000
-        lines.append(f"| {rate} | {val:.1f} {unit} |")
+        print(f"| {rate} | {val:.1f} {unit} |", file=out)
     
     # Recommendations
-    lines.extend([
+    _write_lines(out, [
         "",
         "---",
         "",
@@ -433,45 +636,42 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
     ])
     
     # Find repeated numeric fields
-    repeated_numerics = []
-    for msg_name, msg in messages.items():
-        for field in msg.get('fields', []):
-            if field.get('is_repeated') and field['type'] in ['uint32', 'uint64', 'int32', 'int64']:
-                repeated_numerics.append(f"`{msg_name}.{field['name']}`")
+    repeated_numerics = [
+        f"`{msg_name}.{field_name}`"
+        for msg_name, msg in messages.items()
+        for field_name in msg.get('repeated_numerics', ())
+    ]
     
     if repeated_numerics:
-        lines.append("**Consider packed encoding for repeated numerics:**")
-        lines.append("")
-        for f in repeated_numerics[:5]:
-            lines.append(f"- {f}")
+        print("**Consider packed encoding for repeated numerics:**", file=out)
+        print(file=out)
+        _write_lines(out, (f"- {f}" for f in repeated_numerics[:5]))
         if len(repeated_numerics) > 5:
-            lines.append(f"- ... and {len(repeated_numerics) - 5} more")
-        lines.append("")
+            print(f"- ... and {len(repeated_numerics) - 5} more", file=out)
+        print(file=out)
     
     # Large messages
-    large_msgs = [s for s in size_data if s[4] > 10000]
+    large_msgs = list(islice((s for s in size_data if s[4] > 10000), 5))
     if large_msgs:
-        lines.append("**Large messages (>10KB max) - consider streaming:**")
-        lines.append("")
-        for name, _, _, _, max_s in large_msgs[:5]:
-            lines.append(f"- `{name}` ({max_s:,} bytes max)")
-        lines.append("")
+        print("**Large messages (>10KB max) - consider streaming:**", file=out)
+        print(file=out)
+        _write_lines(out, (f"- `{name}` ({max_s:,} bytes max)" for name, _, _, _, max_s in large_msgs))
+        print(file=out)
     
     # High field numbers
-    high_field_msgs = []
-    for msg_name, msg in messages.items():
-        high = [f for f in msg.get('fields', []) if f['number'] > 15]
-        if high and msg_name in ['Uplink', 'Downlink', 'Registration']:
-            high_field_msgs.append((msg_name, len(high)))
+    high_field_msgs = [
+        (msg_name, msg['high_number_fields'])
+        for msg_name, msg in messages.items()
+        if msg.get('high_number_fields') and msg_name in ['Uplink', 'Downlink', 'Registration']
+    ]
     
     if high_field_msgs:
-        lines.append("**High field numbers (2-byte tags) in frequent messages:**")
-        lines.append("")
-        for name, count in high_field_msgs:
-            lines.append(f"- `{name}`: {count} fields with number > 15")
-        lines.append("")
+        print("**High field numbers (2-byte tags) in frequent messages:**", file=out)
+        print(file=out)
+        _write_lines(out, (f"- `{name}`: {count} fields with number > 15" for name, count in high_field_msgs))
+        print(file=out)
     
-    lines.extend([
+    _write_lines(out, [
         "### Security",
         "",
         "- Validate string field lengths to prevent memory exhaustion",
@@ -485,10 +685,9 @@ def generate_report(proto_path: Path, parsed: dict, spec_content: str = None,
         "- Message sizes (p50, p95, p99)",
         "- Serialization/deserialization latency",
         "- Validation failure rates",
-        "",
     ])
     
-    return '\n'.join(lines)
+    return out.getvalue()
 
 
 def run_self_test() -> bool:
@@ -521,6 +720,15 @@ def run_self_test() -> bool:
     assert len(parsed['enums']['Status']) == 3, "Expected 3 enum values"
     assert parsed['messages']['TestMessage']['field_count'] == 4, "Expected 4 fields"
     
+    summary = parse_proto_file(test_proto, level='summary')
+    assert summary['messages']['TestMessage']['field_count'] == 4, "Expected 4 fields in summary"
+    assert summary['enums'] == parsed['enums'], "Summary should keep enums"
+    
+    other_proto = 'syntax = "proto2";\nmessage Other {\n    optional Status s = 1;\n}\n'
+    merged = parse_proto_files([test_proto, other_proto])
+    joined = parse_proto_file(test_proto + '\n' + other_proto + '\n')
+    assert merged == joined, "Per-file parse should merge like a joined parse"
+    
     print("  Parsing: OK")
     
     # Test size estimation
@@ -592,25 +800,28 @@ Examples:
         parser.error("proto_files required (unless using --self-test)")
     
     # Parse all proto files
-    all_content = ""
+    proto_texts = []
     for proto_file in args.proto_files:
         if proto_file.exists():
-            all_content += proto_file.read_text() + "\n"
+            proto_texts.append(proto_file.read_text())
         else:
             log_warn(f"File not found: {proto_file}")
     
-    if not all_content:
+    if not proto_texts:
         log_warn("No proto content found")
         sys.exit(1)
     
-    parsed = parse_proto_file(all_content)
+    level = 'summary' if args.json else 'full'
+    if len(proto_texts) > 1 and sum(map(len, proto_texts)) >= PARALLEL_PARSE_MIN_SIZE:
+        parsed = parse_proto_files(proto_texts, level=level)
+    else:
+        # Joined once; each file ends with a newline
+        parsed = parse_proto_file('\n'.join(proto_texts + ['']), level=level)
     
     # Load spec content if provided
     spec_content = None
     if args.spec_dir and args.spec_dir.exists():
-        spec_content = ""
-        for md_file in args.spec_dir.glob("*.md"):
-            spec_content += md_file.read_text() + "\n"
+        spec_content = '\n'.join([md_file.read_text() for md_file in args.spec_dir.glob("*.md")] + [''])
     
     if args.json:
         output = json.dumps({
@@ -16,17 +16,109 @@ Extracts:
 Usage:
     python analyze_ttn_codec.py <codec.js>
     python analyze_ttn_codec.py <codec.js> --yaml  # Output draft schema
+    python analyze_ttn_codec.py <codec.js> --fast  # Use RE2 if installed
 """
 
 import re
 import sys
 import json
 import argparse
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
 
+from dataclass_slots import add_slots
 
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Patterns used by the analysis pipeline, compiled once at import time
+_TLV_RE = re.compile(r'channel_id|channel_type|data\[i\+\+\]|for\s*\([^)]*i\s*<\s*bytes\.length')
+# fPort cases, switch and byte-testing if statements in one alternation;
+# m.lastgroup names the kind. TLV markers stay a separate search, since
+# they can sit inside a switch or if header this scan consumes whole
+_STRUCTURE_RE = re.compile(
+    r'case\s+(?P<fport>\d+):'
+    r'|switch\s*\((?P<switch>[^)]+)\)\s*\{'
+    r'|if\s*\((?P<if>[^)]*bytes\[\d+\][^)]*)\)'
+)
+_FIELD_RE = re.compile(r'(?:decoded|data|obj)\.(\w+)\s*=\s*([^;]+);')
+_INLINE_RE = re.compile(r'^\s*(\w+):\s*([^,\n]+)[,\n]', re.MULTILINE)
+_INPUT_REF_RE = re.compile(r'bytes|data|input')
+# Every token analyze_expression cares about, so one scan classifies them all
+_EXPR_TOKEN_RE = re.compile(
+    r'bytes\[(?P<byte>\d+)\]'
+    r'|<<\s*(?P<lshift>\d+)'
+    r'|&\s*0x(?=(?P<mask>[0-9A-Fa-f]+))'  # Lookahead keeps 'b' available to bytes[
+    r'|>>\s*(?P<shift>\d+)'
+    r'|/\s*(?P<div>[\d.]+)'
+    r'|\*\s*(?P<mult>[\d.]+)'
+    r'|(?P<sign>[+-])\s*(?P<add>\d+)(?!\s*\])'  # Avoid matching array indices
+)
+_TERNARY_RE = re.compile(r'(\w+)\s*===?\s*(\d+)\s*\?\s*["\']([^"\']+)["\']')
+_CASE_STRING_RE = re.compile(r'case\s+(\d+):[^}]*?["\']([^"\']+)["\']', re.DOTALL)
+_IF_COND_RE = re.compile(r'if\s*\(([^)]+)\)')
+_CASE_COND_RE = re.compile(r'case\s+([^:]+):')
+_NEWLINE_RE = re.compile(r'\n')
+# Whole words only, so identifiers like 'notify' or 'elsewhere' don't count
+_COND_KEYWORD_RE = re.compile(r'\b(?:if|case|else)\b')
+
+# Field confidence levels
+HIGH = "high"
+MEDIUM = "medium"
+LOW = "low"
+
+# Set-bit count of a mask; int.bit_count() needs Python 3.10
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+# Whole-file scans with no lookaround, which RE2 can run as-is
+_RE2_PATTERNS = (
+    '_TLV_RE', '_STRUCTURE_RE', '_FIELD_RE', '_INLINE_RE',
+    '_TERNARY_RE', '_CASE_STRING_RE',
+)
+
+
+def use_re2() -> bool:
+    """Run the whole-file scans on RE2 (google-re2) instead of re.
+    
+    RE2 matches in linear time without backtracking, but its \\w, \\d and
+    \\s classes are ASCII-only, so this is opt-in (--fast). Returns False
+    when google-re2 is not installed.
+    """
+    if not HAS_RE2:
+        return False
+    
+    patterns = globals()
+    for name in _RE2_PATTERNS:
+        pattern = patterns[name]
+        if not isinstance(pattern, re.Pattern):
+            continue  # Already switched
+        inline = ''
+        if pattern.flags & re.MULTILINE:
+            inline += 'm'
+        if pattern.flags & re.DOTALL:
+            inline += 's'
+        source = f'(?{inline}){pattern.pattern}' if inline else pattern.pattern
+        patterns[name] = re2.compile(source)
+    return True
+
+
+@add_slots
 @dataclass
 class FieldInfo:
     """Extracted field information."""
@@ -42,10 +134,35 @@ class FieldInfo:
     lookup: Optional[dict] = None
     condition: Optional[str] = None
     raw_expression: str = ""
-    confidence: str = "high"  # high, medium, low
+    confidence: str = HIGH  # HIGH, MEDIUM, LOW
     notes: list = field(default_factory=list)
+    
+    @classmethod
+    def _bare(cls, name: str, raw_expression: str) -> "FieldInfo":
+        """Build a FieldInfo with defaults, skipping the keyword __init__.
+        
+        Used for the many fields extract_fields creates; keep in step with
+        the defaults above.
+        """
+        self = object.__new__(cls)
+        self.name = name
+        self.byte_indices = []
+        self.bit_mask = None
+        self.bit_shift = None
+        self.multiplier = None
+        self.divisor = None
+        self.offset = None
+        self.signed = False
+        self.size = 1
+        self.lookup = None
+        self.condition = None
+        self.raw_expression = raw_expression
+        self.confidence = HIGH
+        self.notes = []
+        return self
 
 
+@add_slots
 @dataclass
 class CodecAnalysis:
     """Complete codec analysis result."""
@@ -63,60 +180,57 @@ def analyze_codec(js_code: str, filename: str = "codec.js") -> CodecAnalysis:
     """Analyze a TTN JavaScript codec."""
     analysis = CodecAnalysis(filename=filename)
     
-    # Detect TLV pattern
-    if re.search(r'channel_id|channel_type|data\[i\+\+\]|for\s*\([^)]*i\s*<\s*bytes\.length', js_code):
-        analysis.is_tlv = True
-        analysis.warnings.append("TLV/variable-length format detected - requires schema extension")
+    # Detect TLV pattern, fPort cases and conditionals
+    extract_structure(js_code, analysis)
     
     # Detect endianness
     if 'LE' in js_code or 'little' in js_code.lower():
         analysis.endian = "little"
     
-    # Extract fPort cases
-    fport_matches = re.findall(r'case\s+(\d+):', js_code)
-    analysis.fports = [int(p) for p in fport_matches]
-    
     # Extract field assignments
     extract_fields(js_code, analysis)
     
     # Extract lookup tables
     extract_lookups(js_code, analysis)
     
-    # Extract conditionals
-    extract_conditionals(js_code, analysis)
-    
     return analysis
 
 
 def extract_fields(js_code: str, analysis: CodecAnalysis):
     """Extract field definitions from JS code."""
+    # (name, expression) pairs already recorded, for the duplicate check below
+    seen = {(f.name, f.raw_expression) for f in analysis.fields}
+    # Newline offsets, located once for every field's context lookup
+    newlines = [m.start() for m in _NEWLINE_RE.finditer(js_code)]
     
     # Pattern 1: decoded.fieldName = expression
     # or: data.fieldName = expression
-    field_pattern = r'(?:decoded|data|obj)\.(\w+)\s*=\s*([^;]+);'
-    
-    for match in re.finditer(field_pattern, js_code):
+    for match in _FIELD_RE.finditer(js_code):
         name = match.group(1)
         expr = match.group(2).strip()
         
-        field = FieldInfo(name=name, raw_expression=expr)
+        field = FieldInfo._bare(name, expr)
         
         # Analyze the expression
         analyze_expression(expr, field)
         
         # Check for conditions
-        context = get_context(js_code, match.start(), lines_before=5)
-        if 'if' in context or 'case' in context or 'else' in context:
-            field.condition = extract_condition(context)
-            field.confidence = "medium"
+        position = match.start()
+        start = get_context_start(newlines, position, lines_before=5)
+        if _COND_KEYWORD_RE.search(js_code, start, position):
+            field.condition = extract_condition(js_code[start:position])
+            field.confidence = MEDIUM
         
         analysis.fields.append(field)
+        seen.add((name, expr))
     
     # Pattern 2: Inline object syntax - fieldName: expression,
     # Common in return { data: { field: value, ... } }
-    inline_pattern = r'^\s*(\w+):\s*([^,\n]+)[,\n]'
+    # Every match contains a ':', so code without one skips the line scan
+    if ':' not in js_code:
+        return
     
-    for match in re.finditer(inline_pattern, js_code, re.MULTILINE):
+    for match in _INLINE_RE.finditer(js_code):
         name = match.group(1)
         expr = match.group(2).strip()
         
@@ -127,79 +241,97 @@ def extract_fields(js_code: str, analysis: CodecAnalysis):
         # Skip if expression doesn't reference bytes
         if 'bytes[' not in expr and 'data[' not in expr:
             # Could be a literal or reference - still useful
-            if not re.search(r'bytes|data|input', expr):
+            if not _INPUT_REF_RE.search(expr):
                 continue
         
-        field = FieldInfo(name=name, raw_expression=expr)
+        # Avoid duplicates
+        key = (name, expr)
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        field = FieldInfo._bare(name, expr)
         analyze_expression(expr, field)
         
         # Check for conditions
-        context = get_context(js_code, match.start(), lines_before=5)
-        if 'if' in context or 'case' in context or 'else' in context:
-            field.condition = extract_condition(context)
-            field.confidence = "medium"
+        position = match.start()
+        start = get_context_start(newlines, position, lines_before=5)
+        if _COND_KEYWORD_RE.search(js_code, start, position):
+            field.condition = extract_condition(js_code[start:position])
+            field.confidence = MEDIUM
         
-        # Avoid duplicates
-        if not any(f.name == name and f.raw_expression == expr for f in analysis.fields):
-            analysis.fields.append(field)
+        analysis.fields.append(field)
 
 
 def analyze_expression(expr: str, field: FieldInfo):
     """Analyze a JavaScript expression to extract field properties."""
     
+    # Single pass over the expression: collect every byte index, the
+    # largest left shift, and the first occurrence of each other operator
+    byte_indices = []
+    max_shift = None
+    first = {}
+    for match in _EXPR_TOKEN_RE.finditer(expr):
+        kind = match.lastgroup
+        if kind == 'byte':
+            byte_indices.append(int(match.group('byte')))
+        elif kind == 'lshift':
+            shift = int(match.group('lshift'))
+            if max_shift is None or shift > max_shift:
+                max_shift = shift
+        elif kind not in first:
+            first[kind] = match
+    
     # Detect byte access patterns
     # bytes[n], bytes[i + n], input.bytes[n]
-    byte_matches = re.findall(r'bytes\[(\d+)\]', expr)
-    field.byte_indices = [int(b) for b in byte_matches]
+    field.byte_indices = byte_indices
     
     # Detect multi-byte assembly: (bytes[n] << 8) | bytes[n+1]
-    if '<<' in expr and '|' in expr:
-        shifts = re.findall(r'<<\s*(\d+)', expr)
-        if shifts:
-            max_shift = max(int(s) for s in shifts)
-            field.size = (max_shift // 8) + 1
+    if max_shift is not None and '|' in expr:
+        field.size = (max_shift // 8) + 1
     
     # Detect signed conversion patterns
     if any(p in expr for p in ['>> 16', '>> 24', '0x8000', '0x80', 'bin16dec', 'bin8dec', 'readInt16']):
         field.signed = True
     
     # Detect bit masking: & 0xFF, & 0x0F, etc.
-    mask_match = re.search(r'&\s*0x([0-9A-Fa-f]+)', expr)
+    mask_match = first.get('mask')
     if mask_match:
-        field.bit_mask = int(mask_match.group(1), 16)
+        field.bit_mask = int(mask_match.group('mask'), 16)
         # Calculate bit width from mask
         mask_val = field.bit_mask
-        if mask_val in [0x01, 0x03, 0x07, 0x0F, 0x1F, 0x3F, 0x7F, 0xFF]:
-            field.notes.append(f"Mask 0x{mask_val:X} = {bin(mask_val).count('1')} bits")
+        # Contiguous low-bit masks (0x01, 0x0F, 0x3FF, ...) give the width
+        if mask_val and mask_val & (mask_val + 1) == 0:
+            field.notes.append(f"Mask 0x{mask_val:X} = {_popcount(mask_val)} bits")
     
     # Detect bit shifting: >> n
-    shift_match = re.search(r'>>\s*(\d+)', expr)
+    shift_match = first.get('shift')
     if shift_match:
-        field.bit_shift = int(shift_match.group(1))
+        field.bit_shift = int(shift_match.group('shift'))
     
     # Detect division: / 10, / 100, / 1000
-    div_match = re.search(r'/\s*([\d.]+)', expr)
+    div_match = first.get('div')
     if div_match:
-        val = float(div_match.group(1))
+        val = float(div_match.group('div'))
         if val != 0:
             field.multiplier = 1.0 / val
             field.notes.append(f"Division by {val} → mult: {field.multiplier}")
     
     # Detect multiplication: * 0.01, * 0.1
-    mult_match = re.search(r'\*\s*([\d.]+)', expr)
+    mult_match = first.get('mult')
     if mult_match:
-        field.multiplier = float(mult_match.group(1))
+        field.multiplier = float(mult_match.group('mult'))
     
     # Detect offset/addition: + 25, - 32
-    add_match = re.search(r'([+-])\s*(\d+)(?!\s*\])', expr)  # Avoid matching array indices
+    add_match = first.get('add')
     if add_match:
-        sign = 1 if add_match.group(1) == '+' else -1
-        field.offset = sign * int(add_match.group(2))
+        sign = 1 if add_match.group('sign') == '+' else -1
+        field.offset = sign * int(add_match.group('add'))
     
     # Detect ternary/lookup inline
     if '?' in expr and ':' in expr:
         field.notes.append("Contains ternary - may need lookup table")
-        field.confidence = "medium"
+        field.confidence = MEDIUM
     
     # Detect parseFloat/toFixed
     if 'parseFloat' in expr or 'toFixed' in expr:
@@ -210,10 +342,8 @@ def extract_lookups(js_code: str, analysis: CodecAnalysis):
     """Extract lookup tables and enums."""
     
     # Pattern: value === n ? "string" : ...
-    ternary_pattern = r'(\w+)\s*===?\s*(\d+)\s*\?\s*["\']([^"\']+)["\']'
-    
     lookups = {}
-    for match in re.finditer(ternary_pattern, js_code):
+    for match in _TERNARY_RE.finditer(js_code):
         var_name = match.group(1)
         value = int(match.group(2))
         label = match.group(3)
@@ -223,8 +353,7 @@ def extract_lookups(js_code: str, analysis: CodecAnalysis):
         lookups[var_name][value] = label
     
     # Pattern: case n: ... = "string"
-    case_string_pattern = r'case\s+(\d+):[^}]*?["\']([^"\']+)["\']'
-    for match in re.finditer(case_string_pattern, js_code, re.DOTALL):
+    for match in _CASE_STRING_RE.finditer(js_code):
         value = int(match.group(1))
         label = match.group(2)
         if 'switch_lookup' not in lookups:
@@ -234,50 +363,63 @@ def extract_lookups(js_code: str, analysis: CodecAnalysis):
     analysis.lookups = lookups
 
 
-def extract_conditionals(js_code: str, analysis: CodecAnalysis):
-    """Extract conditional structures."""
-    
-    # switch statements
-    switch_pattern = r'switch\s*\(([^)]+)\)\s*\{'
-    for match in re.finditer(switch_pattern, js_code):
-        var = match.group(1).strip()
-        analysis.conditionals.append({
-            'type': 'switch',
-            'variable': var,
-            'position': match.start()
-        })
-    
-    # if statements with byte comparisons
-    if_pattern = r'if\s*\(([^)]*bytes\[\d+\][^)]*)\)'
-    for match in re.finditer(if_pattern, js_code):
-        condition = match.group(1).strip()
-        analysis.conditionals.append({
-            'type': 'if',
-            'condition': condition,
-            'position': match.start()
-        })
-
-
-def get_context(js_code: str, position: int, lines_before: int = 3) -> str:
-    """Get surrounding context for a position in code."""
-    start = js_code.rfind('\n', 0, position)
-    for _ in range(lines_before):
-        prev = js_code.rfind('\n', 0, start)
-        if prev == -1:
-            break
-        start = prev
-    return js_code[start:position]
+def extract_structure(js_code: str, analysis: CodecAnalysis):
+    """Detect TLV format, fPort cases and conditional structures.
+    
+    One scan of the code for fPorts and conditionals; conditionals list
+    switch statements first, then if statements with byte comparisons.
+    """
+    if _TLV_RE.search(js_code):
+        analysis.is_tlv = True
+        analysis.warnings.append("TLV/variable-length format detected - requires schema extension")
+    
+    fports = []
+    switches = []
+    ifs = []
+    for match in _STRUCTURE_RE.finditer(js_code):
+        kind = match.lastgroup
+        if kind == 'fport':
+            fports.append(int(match.group('fport')))
+        elif kind == 'switch':
+            switches.append({
+                'type': 'switch',
+                'variable': match.group('switch').strip(),
+                'position': match.start()
+            })
+        else:
+            ifs.append({
+                'type': 'if',
+                'condition': match.group('if').strip(),
+                'position': match.start()
+            })
+    
+    analysis.fports = fports
+    analysis.conditionals.extend(switches)
+    analysis.conditionals.extend(ifs)
+
+
+def get_context_start(newlines: list, position: int, lines_before: int = 3) -> int:
+    """Get the start offset of the context preceding a position in code.
+    
+    newlines holds the sorted offsets of every newline in the code. The
+    context starts at most lines_before lines above the position's line;
+    a position on the first line has no context and returns itself.
+    """
+    index = bisect_left(newlines, position) - 1
+    if index < 0:
+        return position
+    return newlines[max(0, index - lines_before)]
 
 
 def extract_condition(context: str) -> Optional[str]:
     """Extract condition from context."""
     # Look for if conditions
-    if_match = re.search(r'if\s*\(([^)]+)\)', context)
+    if_match = _IF_COND_RE.search(context)
     if if_match:
         return if_match.group(1).strip()
     
     # Look for case values
-    case_match = re.search(r'case\s+([^:]+):', context)
+    case_match = _CASE_COND_RE.search(context)
     if case_match:
         return f"case {case_match.group(1).strip()}"
     
@@ -299,16 +441,14 @@ def generate_yaml_draft(analysis: CodecAnalysis) -> str:
     ]
     
     for field in analysis.fields:
-        lines.append(f"  # {field.raw_expression[:60]}...")
+        # Each field's block is built on its own and added to lines once
+        block = [f"  # {field.raw_expression[:60]}..."]
         if field.notes:
-            for note in field.notes:
-                lines.append(f"  # NOTE: {note}")
-        if field.confidence != "high":
-            lines.append(f"  # CONFIDENCE: {field.confidence}")
+            block.extend([f"  # NOTE: {note}" for note in field.notes])
+        if field.confidence != HIGH:
+            block.append(f"  # CONFIDENCE: {field.confidence}")
         if field.condition:
-            lines.append(f"  # CONDITION: {field.condition}")
-        
-        lines.append(f"  - name: {field.name}")
+            block.append(f"  # CONDITION: {field.condition}")
         
         # Determine type
         type_str = "u8"
@@ -317,20 +457,22 @@ def generate_yaml_draft(analysis: CodecAnalysis) -> str:
         elif field.size > 1:
             type_str = f"u{field.size * 8}"
         
-        # Add bitfield notation if needed
+        # Add bitfield notation if needed, on a base wide enough for the bits
         if field.bit_mask and field.bit_shift is not None:
-            width = bin(field.bit_mask).count('1')
+            width = _popcount(field.bit_mask)
             end_bit = field.bit_shift + width - 1
-            type_str = f"u8[{field.bit_shift}:{end_bit}]"
+            base_size = max(field.size, end_bit // 8 + 1)
+            type_str = f"u{base_size * 8}[{field.bit_shift}:{end_bit}]"
         
-        lines.append(f"    type: {type_str}")
+        block.append(f"  - name: {field.name}\n    type: {type_str}")
         
         if field.multiplier:
-            lines.append(f"    mult: {field.multiplier}")
+            block.append(f"    mult: {field.multiplier}")
         if field.offset:
-            lines.append(f"    add: {field.offset}")
+            block.append(f"    add: {field.offset}")
         
-        lines.append("")
+        block.append("")
+        lines.append("\n".join(block))
     
     # Add lookups
     if analysis.lookups:
@@ -350,60 +492,79 @@ def generate_yaml_draft(analysis: CodecAnalysis) -> str:
     return "\n".join(lines)
 
 
+def write_json(obj, out=None):
+    """Write obj as indented JSON to out (stdout by default).
+    
+    Uses orjson when installed; otherwise json.dump streams the encoded
+    chunks to out instead of building the whole string first.
+    """
+    if out is None:
+        out = sys.stdout
+    if HAS_ORJSON:
+        out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+    else:
+        json.dump(obj, out, indent=2)
+    out.write("\n")
+
+
 def print_analysis(analysis: CodecAnalysis):
     """Print analysis in human-readable format."""
-    print(f"\n{'='*60}")
-    print(f"CODEC ANALYSIS: {analysis.filename}")
-    print(f"{'='*60}")
+    # Collected and written at once rather than one print() per line
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"CODEC ANALYSIS: {analysis.filename}")
+    out.append(f"{'='*60}")
     
     if analysis.warnings:
-        print("\n⚠️  WARNINGS:")
+        out.append("\n⚠️  WARNINGS:")
         for w in analysis.warnings:
-            print(f"   - {w}")
+            out.append(f"   - {w}")
     
-    print(f"\n📋 SUMMARY:")
-    print(f"   Endianness: {analysis.endian}")
-    print(f"   fPorts: {analysis.fports or 'not detected'}")
-    print(f"   Fields: {len(analysis.fields)}")
-    print(f"   Conditionals: {len(analysis.conditionals)}")
-    print(f"   Lookup tables: {len(analysis.lookups)}")
-    print(f"   TLV format: {analysis.is_tlv}")
+    out.append(f"\n📋 SUMMARY:")
+    out.append(f"   Endianness: {analysis.endian}")
+    out.append(f"   fPorts: {analysis.fports or 'not detected'}")
+    out.append(f"   Fields: {len(analysis.fields)}")
+    out.append(f"   Conditionals: {len(analysis.conditionals)}")
+    out.append(f"   Lookup tables: {len(analysis.lookups)}")
+    out.append(f"   TLV format: {analysis.is_tlv}")
     
-    print(f"\n📊 FIELDS:")
+    out.append(f"\n📊 FIELDS:")
     for f in analysis.fields:
-        conf_icon = "✓" if f.confidence == "high" else "?" if f.confidence == "medium" else "⚠"
-        print(f"\n   {conf_icon} {f.name}")
-        print(f"      Bytes: {f.byte_indices or '?'}")
+        conf_icon = "✓" if f.confidence == HIGH else "?" if f.confidence == MEDIUM else "⚠"
+        out.append(f"\n   {conf_icon} {f.name}")
+        out.append(f"      Bytes: {f.byte_indices or '?'}")
         if f.size > 1:
-            print(f"      Size: {f.size} bytes")
+            out.append(f"      Size: {f.size} bytes")
         if f.signed:
-            print(f"      Signed: yes")
+            out.append(f"      Signed: yes")
         if f.bit_mask:
-            print(f"      Mask: 0x{f.bit_mask:X}")
+            out.append(f"      Mask: 0x{f.bit_mask:X}")
         if f.bit_shift:
-            print(f"      Shift: >> {f.bit_shift}")
+            out.append(f"      Shift: >> {f.bit_shift}")
         if f.multiplier:
-            print(f"      Multiplier: {f.multiplier}")
+            out.append(f"      Multiplier: {f.multiplier}")
         if f.offset:
-            print(f"      Offset: {f.offset:+}")
+            out.append(f"      Offset: {f.offset:+}")
         if f.condition:
-            print(f"      Condition: {f.condition}")
+            out.append(f"      Condition: {f.condition}")
         if f.notes:
             for note in f.notes:
-                print(f"      Note: {note}")
-        print(f"      Expression: {f.raw_expression[:50]}...")
+                out.append(f"      Note: {note}")
+        out.append(f"      Expression: {f.raw_expression[:50]}...")
     
     if analysis.lookups:
-        print(f"\n📖 LOOKUP TABLES:")
+        out.append(f"\n📖 LOOKUP TABLES:")
         for name, table in analysis.lookups.items():
-            print(f"\n   {name}:")
+            out.append(f"\n   {name}:")
             for k, v in sorted(table.items()):
-                print(f"      {k}: {v}")
+                out.append(f"      {k}: {v}")
     
     if analysis.conditionals:
-        print(f"\n🔀 CONDITIONALS:")
+        out.append(f"\n🔀 CONDITIONALS:")
         for c in analysis.conditionals:
-            print(f"   - {c['type']}: {c.get('variable') or c.get('condition')}")
+            out.append(f"   - {c['type']}: {c.get('variable') or c.get('condition')}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -411,8 +572,13 @@ def main():
     parser.add_argument('codec_file', help='JavaScript codec file to analyze')
     parser.add_argument('--yaml', action='store_true', help='Output draft YAML schema')
     parser.add_argument('--json', action='store_true', help='Output JSON analysis')
+    parser.add_argument('--fast', action='store_true',
+                        help='Use the RE2 regex engine (requires google-re2)')
     args = parser.parse_args()
     
+    if args.fast and not use_re2():
+        print("Warning: google-re2 not installed, using re", file=sys.stderr)
+    
     with open(args.codec_file, 'r') as f:
         js_code = f.read()
     
@@ -449,7 +615,7 @@ def main():
             'is_tlv': analysis.is_tlv,
             'endian': analysis.endian,
         }
-        print(json.dumps(result, indent=2))
+        write_json(result)
     else:
         print_analysis(analysis)
 
@@ -10,19 +10,38 @@ Scans the lorawan-devices vendor directory and produces:
 Usage:
     python batch_analyze_codecs.py /path/to/lorawan-devices/vendor
     python batch_analyze_codecs.py /path/to/lorawan-devices/vendor --output-dir ./drafts
+    python batch_analyze_codecs.py /path/to/lorawan-devices/vendor --fast  # RE2 if installed
 """
 
 import argparse
-import json
+import mmap
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from dataclasses import dataclass
+from itertools import repeat
+from typing import NamedTuple
 
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent))
-from analyze_ttn_codec import analyze_codec, generate_yaml_draft, CodecAnalysis
+from analyze_ttn_codec import analyze_codec, generate_yaml_draft, use_re2, write_json, CodecAnalysis
+
+# Directories with at least this many .js files are analyzed in worker
+# processes on multi-core machines; below it, process startup costs more
+# than it saves
+PARALLEL_MIN_FILES = 256
+
+# Codec categories, also the keys of the results lists
+SIMPLE = "simple"
+COMPLEX = "complex"
+TLV = "tlv"
+
+# Entries per category listed by print_summary
+SUMMARY_SAMPLES = 10
 
 
 @dataclass
@@ -46,106 +65,251 @@ class BatchStats:
     multi_fport: int = 0
 
 
+class CodecSummary(NamedTuple):
+    """Per-codec counts a worker sends back instead of the full analysis."""
+    fields: int
+    fports: list
+    is_tlv: bool
+    warnings: list
+    fields_with_multiplier: int
+    fields_with_offset: int
+    fields_with_bitfield: int
+    fields_signed: int
+    has_lookups: bool
+    has_conditionals: bool
+
+
+def summarize_codec(analysis: CodecAnalysis) -> CodecSummary:
+    """Reduce an analysis to the counts batch stats and results need."""
+    with_multiplier = with_offset = with_bitfield = signed = 0
+    for field in analysis.fields:
+        if field.multiplier:
+            with_multiplier += 1
+        if field.offset:
+            with_offset += 1
+        if field.bit_mask or field.bit_shift:
+            with_bitfield += 1
+        if field.signed:
+            signed += 1
+    return CodecSummary(
+        len(analysis.fields), analysis.fports, analysis.is_tlv, analysis.warnings,
+        with_multiplier, with_offset, with_bitfield, signed,
+        bool(analysis.lookups), bool(analysis.conditionals),
+    )
+
+
 def categorize_codec(analysis: CodecAnalysis) -> str:
     """Categorize codec by conversion difficulty."""
     if analysis.is_tlv:
-        return "tlv"
+        return TLV
     
     if len(analysis.conditionals) > 3 or len(analysis.fields) > 20:
-        return "complex"
+        return COMPLEX
     
     # Check for complex conditions
     complex_conditions = sum(1 for f in analysis.fields if f.condition)
     if complex_conditions > 5:
-        return "complex"
+        return COMPLEX
+    
+    return SIMPLE
+
+
+def iter_js_files(root: Path):
+    """Yield the paths of .js files under root as strings.
+    
+    Walks with os.scandir in the same order as root.rglob("*.js"): each
+    directory's files, then its subdirectories depth first, without
+    building a Path per entry.
+    """
+    # Paths are joined like Path's, so Path('.') yields 'a.js', not './a.js'
+    top = str(root)
+    stack = ['' if top == '.' else top]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory or '.') as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(os.path.join(directory, entry.name))
+            elif entry.name.endswith('.js'):
+                yield os.path.join(directory, entry.name)
+        stack.extend(reversed(subdirs))
+
+
+def analyze_codec_file(js_file: str, make_draft: bool = False):
+    """Analyze one codec file.
     
-    return "simple"
+    Returns None for files that are not codecs, otherwise a
+    (category, summary, draft) tuple, where summary is a CodecSummary and
+    draft the YAML draft for simple codecs with fields when make_draft is
+    set. Runs in worker processes, so only these small records are
+    pickled back, and failures come back as ('errors', message, None)
+    instead of raising.
+    """
+    try:
+        # Skip very short files (likely not codecs) without opening them
+        if os.stat(js_file).st_size < 100:
+            return None
+        
+        # Skip files that don't look like codecs before decoding them
+        with open(js_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'decodeUplink') < 0 and mm.find(b'Decoder') < 0:
+                    return None
+                js_code = mm[:].decode('utf-8', errors='ignore')
+        
+        if len(js_code) < 100:
+            return None
+        
+        analysis = analyze_codec(js_code, str(js_file))
+        category = categorize_codec(analysis)
+        
+        draft = None
+        if make_draft and category == SIMPLE and len(analysis.fields) > 0:
+            draft = generate_yaml_draft(analysis)
+        return category, summarize_codec(analysis), draft
+    
+    except Exception as e:
+        return 'errors', str(e), None
 
 
-def analyze_vendor_directory(vendor_path: Path, output_dir: Path = None) -> dict:
-    """Analyze all codecs in a vendor directory."""
+def write_drafts(drafts: queue.Queue, output_dir: Path, errors: list):
+    """Write (rel_path, draft) items from the queue until None arrives.
+    
+    Runs on a background thread so disk writes overlap the analysis;
+    failures are collected as (rel_path, message) pairs in errors.
+    """
+    made_dirs = set()
+    while True:
+        item = drafts.get()
+        if item is None:
+            return
+        rel_path, draft = item
+        try:
+            draft_path = output_dir / rel_path.with_suffix('.yaml')
+            if draft_path.parent not in made_dirs:
+                draft_path.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(draft_path.parent)
+            with open(draft_path, 'w') as f:
+                f.write(draft)
+        except Exception as e:
+            errors.append((rel_path, str(e)))
+
+
+def analyze_vendor_directory(vendor_path: Path, output_dir: Path = None, fast: bool = False,
+                             max_results: int = None) -> dict:
+    """Analyze all codecs in a vendor directory.
+    
+    With fast, the whole-file scans run on RE2 when google-re2 is installed.
+    max_results caps the entries kept per results category (None keeps
+    all); the stats always cover every file.
+    """
     stats = BatchStats()
     results = {
-        'simple': [],
-        'complex': [],
-        'tlv': [],
+        SIMPLE: [],
+        COMPLEX: [],
+        TLV: [],
         'errors': []
     }
     
-    js_files = list(vendor_path.rglob("*.js"))
+    def record(category: str, entry: dict):
+        entries = results[category]
+        if max_results is None or len(entries) < max_results:
+            entries.append(entry)
+    
+    js_files = list(iter_js_files(vendor_path))
     stats.total = len(js_files)
     
     print(f"Found {stats.total} JavaScript codec files")
     print("Analyzing...\n")
     
-    for js_file in js_files:
-        try:
-            with open(js_file, 'r', encoding='utf-8', errors='ignore') as f:
-                js_code = f.read()
-            
-            # Skip very short files (likely not codecs)
-            if len(js_code) < 100:
-                continue
-            
-            # Skip files that don't look like codecs
-            if 'decodeUplink' not in js_code and 'Decoder' not in js_code:
-                continue
-            
-            analysis = analyze_codec(js_code, str(js_file))
-            category = categorize_codec(analysis)
-            
-            # Update stats
-            if category == "simple":
-                stats.simple_fixed += 1
-            elif category == "complex":
-                stats.complex_fixed += 1
-            elif category == "tlv":
-                stats.tlv_format += 1
-            
-            stats.total_fields += len(analysis.fields)
-            
-            for field in analysis.fields:
-                if field.multiplier:
-                    stats.fields_with_multiplier += 1
-                if field.offset:
-                    stats.fields_with_offset += 1
-                if field.bit_mask or field.bit_shift:
-                    stats.fields_with_bitfield += 1
-                if field.signed:
-                    stats.fields_signed += 1
-            
-            if analysis.lookups:
-                stats.has_lookups += 1
-            if analysis.conditionals:
-                stats.has_conditionals += 1
-            if len(analysis.fports) > 1:
-                stats.multi_fport += 1
-            
-            # Store result
-            rel_path = js_file.relative_to(vendor_path)
-            result_entry = {
-                'file': str(rel_path),
-                'category': category,
-                'fields': len(analysis.fields),
-                'fports': analysis.fports,
-                'is_tlv': analysis.is_tlv,
-                'warnings': analysis.warnings
-            }
-            results[category].append(result_entry)
-            
-            # Generate draft for simple codecs
-            if output_dir and category == "simple" and len(analysis.fields) > 0:
-                draft_path = output_dir / rel_path.with_suffix('.yaml')
-                draft_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(draft_path, 'w') as f:
-                    f.write(generate_yaml_draft(analysis))
+    if fast and not use_re2():
+        print("Warning: google-re2 not installed, using re", file=sys.stderr)
+    
+    make_draft = output_dir is not None
+    if make_draft:
+        drafts = queue.Queue(maxsize=256)
+        write_errors = []
+        writer = threading.Thread(
+            target=write_drafts, args=(drafts, output_dir, write_errors), daemon=True)
+        writer.start()
+    
+    if len(js_files) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        executor = ProcessPoolExecutor(initializer=use_re2 if fast else None)
+        outcomes = executor.map(analyze_codec_file, js_files, repeat(make_draft), chunksize=32)
+    else:
+        executor = None
+        outcomes = map(analyze_codec_file, js_files, repeat(make_draft))
+    
+    for js_file, outcome in zip(js_files, outcomes):
+        if outcome is None:
+            continue
         
-        except Exception as e:
+        category, summary, draft = outcome
+        # Unpickled from a worker: intern so compares and lookups hit identity
+        category = sys.intern(category)
+        rel_path = os.path.relpath(js_file, vendor_path)
+        if category == 'errors':
             stats.parse_errors += 1
-            results['errors'].append({
-                'file': str(js_file.relative_to(vendor_path)),
-                'error': str(e)
+            record('errors', {
+                'file': rel_path,
+                'error': summary
             })
+            continue
+        
+        # Update stats
+        if category == SIMPLE:
+            stats.simple_fixed += 1
+        elif category == COMPLEX:
+            stats.complex_fixed += 1
+        elif category == TLV:
+            stats.tlv_format += 1
+        
+        stats.total_fields += summary.fields
+        stats.fields_with_multiplier += summary.fields_with_multiplier
+        stats.fields_with_offset += summary.fields_with_offset
+        stats.fields_with_bitfield += summary.fields_with_bitfield
+        stats.fields_signed += summary.fields_signed
+        
+        if summary.has_lookups:
+            stats.has_lookups += 1
+        if summary.has_conditionals:
+            stats.has_conditionals += 1
+        if len(summary.fports) > 1:
+            stats.multi_fport += 1
+        
+        # Store result
+        result_entry = {
+            'file': rel_path,
+            'category': category,
+            'fields': summary.fields,
+            'fports': summary.fports,
+            'is_tlv': summary.is_tlv,
+            'warnings': summary.warnings
+        }
+        record(category, result_entry)
+        
+        # Queue draft for simple codecs (written by one thread, not the workers)
+        if draft is not None:
+            drafts.put((Path(rel_path), draft))
+    
+    if executor is not None:
+        executor.shutdown()
+    
+    if make_draft:
+        drafts.put(None)
+        writer.join()
+        for rel_path, error in write_errors:
+            stats.parse_errors += 1
+            record('errors', {'file': str(rel_path), 'error': error})
     
     return {
         'stats': stats,
@@ -182,12 +346,12 @@ def print_summary(stats: BatchStats, results: dict):
     print(f"   Codecs with conditionals: {stats.has_conditionals}")
     print(f"   Codecs with multiple fPorts: {stats.multi_fport}")
     
-    print(f"\n📁 SAMPLE SIMPLE CODECS (first 10):")
-    for entry in results['simple'][:10]:
+    print(f"\n📁 SAMPLE SIMPLE CODECS (first {SUMMARY_SAMPLES}):")
+    for entry in results[SIMPLE][:SUMMARY_SAMPLES]:
         print(f"   - {entry['file']} ({entry['fields']} fields)")
     
-    print(f"\n📁 SAMPLE TLV CODECS (first 10):")
-    for entry in results['tlv'][:10]:
+    print(f"\n📁 SAMPLE TLV CODECS (first {SUMMARY_SAMPLES}):")
+    for entry in results[TLV][:SUMMARY_SAMPLES]:
         print(f"   - {entry['file']}")
     
     # Time estimate
@@ -207,6 +371,8 @@ def main():
     parser.add_argument('vendor_path', help='Path to lorawan-devices/vendor directory')
     parser.add_argument('--output-dir', '-o', help='Output directory for draft schemas')
     parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    parser.add_argument('--fast', action='store_true',
+                        help='Use the RE2 regex engine (requires google-re2)')
     args = parser.parse_args()
     
     vendor_path = Path(args.vendor_path)
@@ -218,7 +384,9 @@ def main():
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
     
-    data = analyze_vendor_directory(vendor_path, output_dir)
+    # The text summary only lists samples; JSON output lists every file
+    data = analyze_vendor_directory(vendor_path, output_dir, fast=args.fast,
+                                    max_results=None if args.json else SUMMARY_SAMPLES)
     
     if args.json:
         # Convert stats to dict for JSON
@@ -230,7 +398,7 @@ def main():
             'parse_errors': data['stats'].parse_errors,
             'total_fields': data['stats'].total_fields,
         }
-        print(json.dumps({'stats': stats_dict, 'results': data['results']}, indent=2))
+        write_json({'stats': stats_dict, 'results': data['results']})
     else:
         print_summary(data['stats'], data['results'])
 
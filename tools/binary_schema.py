@@ -59,9 +59,20 @@ Usage:
 import struct
 import math
 import base64
+import binascii
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from enum import IntEnum
+from itertools import starmap
+
+from dataclass_slots import add_slots
+
+try:
+    # Built from binary_schema_fast.pyx (cythonize -i)
+    from binary_schema_fast import decode_v2_data_field as _decode_v2_data_field_fast
+    HAS_FAST_DECODER = True
+except ImportError:
+    HAS_FAST_DECODER = False
 
 
 class FieldType(IntEnum):
@@ -83,6 +94,25 @@ OPCODE_OBJECT = 0x72
 OPCODE_VAR = 0x73
 OPCODE_END = 0x74
 
+# Single-byte opcode records, built once
+_VAR_BYTES = bytes([OPCODE_VAR])
+_MATCH_BYTES = bytes([OPCODE_MATCH])
+
+# MATCH flags byte -> (field_ref, is_inline, wide_value, has_default)
+_MATCH_FLAGS = tuple(
+    (flags & 0x0F, bool(flags & 0x10), bool(flags & 0x20), bool(flags & 0x40))
+    for flags in range(256)
+)
+
+
+# Multipliers seen in practice -> mult_exponent byte, checked before the
+# log10 fallback in _mult_to_exponent (0.5 uses the 0xFF special encoding)
+_MULT_EXP_TABLE = {
+    None: 0, 0: 0, 1: 0, 0.5: 0xFF,
+    10: 1, 100: 2, 1000: 3, 10000: 4, 100000: 5, 1000000: 6,
+    0.1: -1, 0.01: -2, 0.001: -3, 0.0001: -4, 0.00001: -5, 0.000001: -6,
+}
+
 
 # Map schema type strings to (FieldType, size_bytes)
 TYPE_MAP = {
@@ -106,6 +136,20 @@ TYPE_MAP = {
     'bool': (FieldType.BOOL, 1),
 }
 
+# 4-byte data field record: type_byte, mult_exp, semantic_id (LE).
+# Encoding packs the exponent as an unsigned byte (the 0.5 special is 0xFF);
+# decoding reads it signed, so struct does the sign extension.
+_FIELD_STRUCT = struct.Struct('<BBH')
+_FIELD_STRUCT_SIGNED = struct.Struct('<BbH')
+_pack_field = _FIELD_STRUCT.pack
+_unpack_field = _FIELD_STRUCT_SIGNED.unpack_from
+_U16_STRUCT = struct.Struct('<H')  # Wide MATCH case values
+_pack_u16 = _U16_STRUCT.pack
+_unpack_u16 = _U16_STRUCT.unpack_from
+
+# Standard -> URL-safe base64 alphabet, for to_base64
+_URLSAFE_TRANS = bytes.maketrans(b'+/', b'-_')
+
 # Reverse map for decoding
 SIZE_TO_TYPE = {
     (FieldType.UNSIGNED, 1): 'u8',
@@ -123,7 +167,23 @@ SIZE_TO_TYPE = {
     (FieldType.BOOL, 1): 'bool',
 }
 
-
+# type_byte -> schema type string, so v2 decode skips building a FieldType
+# per record; None where the type nibble is not a FieldType
+_FIELD_TYPE_CODES = frozenset(FieldType)
+_TYPE_BYTE_TO_TYPE = tuple(
+    SIZE_TO_TYPE.get((type_byte >> 4, type_byte & 0x0F), 'u8')
+    if (type_byte >> 4) in _FIELD_TYPE_CODES else None
+    for type_byte in range(256)
+)
+# Type nibble -> FieldType member (None where invalid), so from_record skips
+# the IntEnum constructor for every field
+_NIBBLE_TO_FIELD_TYPE = tuple(
+    FieldType(nibble) if nibble in _FIELD_TYPE_CODES else None
+    for nibble in range(16)
+)
+
+
+@add_slots
 @dataclass
 class BinaryField:
     """Represents a field in binary schema format."""
@@ -136,28 +196,41 @@ class BinaryField:
     def to_bytes(self) -> bytes:
         """Encode field to 4 bytes."""
         type_byte = (self.type_code << 4) | (self.size & 0x0F)
-        return struct.pack('<BBH', type_byte, 
-                          self.mult_exponent & 0xFF, 
-                          self.semantic_id)
+        return _pack_field(type_byte, self.mult_exponent & 0xFF,
+                           self.semantic_id)
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'BinaryField':
         """Decode field from 4 bytes."""
         if len(data) < 4:
             raise ValueError(f"Need 4 bytes, got {len(data)}")
+        return cls.from_buffer(data, 0)
+    
+    @classmethod
+    def from_buffer(cls, data: bytes, pos: int) -> 'BinaryField':
+        """Decode the 4-byte field at data[pos:pos+4] without slicing it out.
         
-        type_byte, mult_exp, semantic_id = struct.unpack('<BBH', data[:4])
-        type_code = FieldType((type_byte >> 4) & 0x0F)
-        size = type_byte & 0x0F
+        The caller checks that 4 bytes are available.
+        """
+        return cls.from_record(*_unpack_field(data, pos))
+    
+    @classmethod
+    def from_record(cls, type_byte: int, mult_exp: int,
+                    semantic_id: int) -> 'BinaryField':
+        """Build a field from the unpacked (type_byte, mult_exp, semantic_id).
         
-        # Convert signed exponent
-        if mult_exp > 127:
-            mult_exp = mult_exp - 256
+        mult_exp is the signed exponent, as _FIELD_STRUCT_SIGNED reads it.
+        """
+        type_code = _NIBBLE_TO_FIELD_TYPE[(type_byte >> 4) & 0x0F]
+        if type_code is None:
+            FieldType((type_byte >> 4) & 0x0F)  # Raises ValueError
+        size = type_byte & 0x0F
         
         return cls(type_code=type_code, size=size, 
                   mult_exponent=mult_exp, semantic_id=semantic_id)
 
 
+@add_slots
 @dataclass
 class BinarySchema:
     """Binary-encoded schema structure.
@@ -182,17 +255,21 @@ class BinarySchema:
                                 self.record_count)
             return header + self.records
         
-        # Version 1: 2-byte header + 4-byte fields
-        header = struct.pack('BB', self.version, len(self.fields))
-        field_data = b''.join(f.to_bytes() for f in self.fields)
-        return header + field_data
+        # Version 1: 2-byte header + 4-byte fields, packed in one call
+        values = [self.version, len(self.fields)]
+        add = values.extend
+        for f in self.fields:
+            add(((f.type_code << 4) | (f.size & 0x0F),
+                 f.mult_exponent & 0xFF, f.semantic_id))
+        return struct.pack('<BB' + 'BBH' * len(self.fields), *values)
     
     def to_base64(self, url_safe: bool = True) -> str:
         """Encode schema to base64 string."""
         binary = self.to_bytes()
         if url_safe:
-            return base64.urlsafe_b64encode(binary).decode('ascii').rstrip('=')
-        return base64.b64encode(binary).decode('ascii')
+            encoded = binascii.b2a_base64(binary, newline=False)
+            return encoded.translate(_URLSAFE_TRANS).rstrip(b'=').decode('ascii')
+        return binascii.b2a_base64(binary, newline=False).decode('ascii')
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'BinarySchema':
@@ -211,16 +288,15 @@ class BinarySchema:
             return cls(version=version, flags=flags,
                       record_count=record_count, records=data[3:])
         
-        # Version 1: 2-byte header + flat fields
+        # Version 1: 2-byte header + flat fields, unpacked in one pass.
+        # Complete records are decoded before a short tail is reported, so
+        # a bad record ahead of the truncation still raises first.
         count = data[1]
-        fields = []
-        pos = 2
-        for _ in range(count):
-            if pos + 4 > len(data):
-                raise ValueError("Truncated field data")
-            f = BinaryField.from_bytes(data[pos:pos+4])
-            fields.append(f)
-            pos += 4
+        available = min(count, (len(data) - 2) // 4)
+        records = _FIELD_STRUCT_SIGNED.iter_unpack(data[2:2 + 4 * available])
+        fields = list(starmap(BinaryField.from_record, records))
+        if available < count:
+            raise ValueError("Truncated field data")
         
         return cls(version=version, fields=fields)
     
@@ -263,6 +339,11 @@ class BinarySchemaEncoder:
     
     def _mult_to_exponent(self, mult: float) -> int:
         """Convert multiplier to exponent (mult = 10^exp)."""
+        try:
+            return _MULT_EXP_TABLE[mult]
+        except (KeyError, TypeError):
+            pass  # Novel or unhashable value: work it out below
+        
         if mult is None or mult == 1.0:
             return 0
         
@@ -347,19 +428,18 @@ class BinarySchemaEncoder:
         semantic_id = self._get_semantic_id(field_def)
         
         type_byte = (type_code << 4) | (size & 0x0F)
-        return struct.pack('<BBH', type_byte, mult_exp & 0xFF, semantic_id)
+        return _pack_field(type_byte, mult_exp & 0xFF, semantic_id)
     
     def _encode_var_record(self) -> bytes:
         """Encode a VAR opcode (1 byte)."""
-        return bytes([OPCODE_VAR])
+        return _VAR_BYTES
     
     def _encode_match_record(self, match_def: dict) -> bytes:
         """Encode a MATCH record (section 17 compact format).
         
         MATCH: 0x70 + flags(1) + case_count(1) + case entries
         """
-        out = bytearray()
-        out.append(OPCODE_MATCH)
+        out = bytearray(_MATCH_BYTES)
         
         # Build flags
         flags = 0
@@ -401,18 +481,14 @@ class BinarySchemaEncoder:
         # Case entries
         for case_val, case_fields in numbered_cases:
             if wide:
-                out.extend(struct.pack('<H', case_val))
+                out += _pack_u16(case_val)
             else:
                 out.append(case_val & 0xFF)
             
             # Encode case fields
-            encoded_fields = []
-            for cf in case_fields:
-                encoded_fields.append(self._encode_data_field(cf))
-            
+            encoded_fields = [self._encode_data_field(cf) for cf in case_fields]
             out.append(len(encoded_fields))
-            for ef in encoded_fields:
-                out.extend(ef)
+            out += b''.join(encoded_fields)
         
         # Default case (no value byte, just field_count + fields)
         if flags & 0x40:
@@ -420,8 +496,7 @@ class BinarySchemaEncoder:
                 encoded_defaults = [self._encode_data_field(df)
                                    for df in default_fields]
                 out.append(len(encoded_defaults))
-                for ed in encoded_defaults:
-                    out.extend(ed)
+                out += b''.join(encoded_defaults)
             elif default == 'skip' or default_fields == 'skip':
                 out.append(0)  # 0 fields = skip
             elif default == 'error' or default_fields == 'error':
@@ -436,7 +511,7 @@ class BinarySchemaEncoder:
         
         Returns (record_bytes, top_level_record_count).
         """
-        out = bytearray()
+        chunks = []  # Record bytes, joined once at the end
         record_count = 0
         self._var_counter = 0
         self._var_index_map = {}
@@ -450,7 +525,7 @@ class BinarySchemaEncoder:
             # Option B: match: as top-level key
             if 'match' in field_def and not field_def.get('type'):
                 match_def = field_def['match']
-                out.extend(self._encode_match_record(match_def))
+                chunks.append(self._encode_match_record(match_def))
                 record_count += 1
                 continue
             
@@ -474,7 +549,7 @@ class BinarySchemaEncoder:
                     elif 'case' in case:
                         match_def['cases'][case['case']] = case.get(
                             'fields', [])
-                out.extend(self._encode_match_record(match_def))
+                chunks.append(self._encode_match_record(match_def))
                 record_count += 1
                 continue
             
@@ -485,7 +560,7 @@ class BinarySchemaEncoder:
                 continue
             
             # Data field
-            out.extend(self._encode_data_field(field_def))
+            chunks.append(self._encode_data_field(field_def))
             record_count += 1
             
             # VAR record follows if field has var:
@@ -493,10 +568,10 @@ class BinarySchemaEncoder:
                 var_name = field_def['var']
                 self._var_index_map[var_name] = self._var_counter
                 self._var_counter += 1
-                out.extend(self._encode_var_record())
+                chunks.append(self._encode_var_record())
                 # VAR doesn't count as a top-level record (it's a modifier)
         
-        return bytes(out), record_count
+        return b''.join(chunks), record_count
     
     def encode(self, schema: dict) -> BinarySchema:
         """Encode complete schema dict to binary schema.
@@ -540,6 +615,14 @@ class BinarySchemaEncoder:
         """Convenience method: encode schema directly to bytes."""
         return self.encode(schema).to_bytes()
     
+    def encode_with_hash(self, schema: dict) -> Tuple[bytes, int]:
+        """Encode schema to bytes and return them with their CRC32 hash.
+        
+        For OTA transfer, where both are sent: the schema is encoded once.
+        """
+        binary = self.encode(schema).to_bytes()
+        return binary, compute_crc32(binary)
+    
     def encode_to_base64(self, schema: dict, url_safe: bool = True) -> str:
         """Convenience method: encode schema directly to base64."""
         return self.encode(schema).to_base64(url_safe=url_safe)
@@ -558,9 +641,13 @@ class BinarySchemaDecoder:
     
     def decode_field(self, binary_field: BinaryField, index: int) -> dict:
         """Decode binary field to schema dict (v1 format)."""
-        # Determine type string
-        type_key = (binary_field.type_code, binary_field.size)
-        type_str = SIZE_TO_TYPE.get(type_key, 'u8')
+        # Determine type string (table lookup when both fit in a nibble)
+        type_code = binary_field.type_code
+        size = binary_field.size
+        if 0 <= type_code <= 0x0F and 0 <= size <= 0x0F:
+            type_str = _TYPE_BYTE_TO_TYPE[(type_code << 4) | size] or 'u8'
+        else:
+            type_str = SIZE_TO_TYPE.get((type_code, size), 'u8')
         
         field_def = {
             'name': binary_field.name or f'field_{index}',
@@ -585,18 +672,19 @@ class BinarySchemaDecoder:
         Same layout as v1 BinaryField: [type_byte, mult_exp, semantic_id LE].
         Returns (field_def, new_pos, has_var_flag).
         """
+        if HAS_FAST_DECODER:
+            return _decode_v2_data_field_fast(data, pos, field_idx,
+                                              _TYPE_BYTE_TO_TYPE, FieldType)
+        
         if pos + 4 > len(data):
             raise ValueError(f"Truncated field at pos {pos}")
         
-        type_byte, mult_exp, semantic_id = struct.unpack(
-            '<BBH', data[pos:pos + 4])
+        type_byte, mult_exp, semantic_id = _unpack_field(data, pos)
         pos += 4
         
-        type_code = FieldType((type_byte >> 4) & 0x0F)
-        size = type_byte & 0x0F
-        
-        type_key = (type_code, size)
-        type_str = SIZE_TO_TYPE.get(type_key, 'u8')
+        type_str = _TYPE_BYTE_TO_TYPE[type_byte]
+        if type_str is None:
+            FieldType(type_byte >> 4)  # Raises ValueError for the bad nibble
         
         field_def = {
             'name': f'field_{field_idx}',
@@ -606,9 +694,7 @@ class BinarySchemaDecoder:
         if semantic_id:
             field_def['semantic'] = {'ipso': semantic_id}
         
-        # Multiplier from signed exponent byte
-        if mult_exp > 127:
-            mult_exp = mult_exp - 256
+        # Multiplier from the signed exponent byte
         mult = self._exponent_to_mult(mult_exp)
         if mult != 1.0:
             field_def['mult'] = mult
@@ -620,17 +706,16 @@ class BinarySchemaDecoder:
         
         Returns (match_field_def, new_pos).
         """
-        if pos + 2 > len(data):
+        end = len(data)
+        decode_data_field = self._decode_v2_data_field
+        if pos + 2 > end:
             raise ValueError("Truncated MATCH record")
         
         flags = data[pos]
         case_count = data[pos + 1]
         pos += 2
         
-        field_ref = flags & 0x0F
-        is_inline = bool(flags & 0x10)
-        wide_value = bool(flags & 0x20)
-        has_default = bool(flags & 0x40)
+        field_ref, is_inline, wide_value, has_default = _MATCH_FLAGS[flags]
         
         match_def = {}
         if is_inline:
@@ -642,29 +727,29 @@ class BinarySchemaDecoder:
         val_size = 2 if wide_value else 1
         
         for _ in range(case_count):
-            if pos + val_size > len(data):
+            if pos + val_size > end:
                 raise ValueError("Truncated case value")
             if wide_value:
-                case_val = struct.unpack('<H', data[pos:pos + 2])[0]
+                case_val = _unpack_u16(data, pos)[0]
             else:
                 case_val = data[pos]
             pos += val_size
             
-            if pos >= len(data):
+            if pos >= end:
                 raise ValueError("Truncated case field_count")
             field_count = data[pos]
             pos += 1
             
             case_fields = []
             for fi in range(field_count):
-                fd, pos, _ = self._decode_v2_data_field(data, pos, fi)
+                fd, pos, _ = decode_data_field(data, pos, fi)
                 case_fields.append(fd)
             
             cases[case_val] = case_fields
         
         # Default case
         if has_default:
-            if pos >= len(data):
+            if pos >= end:
                 raise ValueError("Truncated default case")
             default_count = data[pos]
             pos += 1
@@ -676,7 +761,7 @@ class BinarySchemaDecoder:
             else:
                 default_fields = []
                 for fi in range(default_count):
-                    fd, pos, _ = self._decode_v2_data_field(data, pos, fi)
+                    fd, pos, _ = decode_data_field(data, pos, fi)
                     default_fields.append(fd)
                 cases['default'] = default_fields
         
@@ -696,8 +781,10 @@ class BinarySchemaDecoder:
         field_idx = 0
         var_counter = 0
         var_names = {}  # index -> name
+        end = len(data)
+        decode_data_field = self._decode_v2_data_field
         
-        while pos < len(data):
+        while pos < end:
             byte = data[pos]
             
             if byte == OPCODE_MATCH:
@@ -723,10 +810,9 @@ class BinarySchemaDecoder:
                     var_names[var_counter] = var_name
                     var_counter += 1
                 
-            elif (byte >> 4) & 0x0F < 0x7:
+            elif byte < 0x70:
                 # Data field (type nibble 0x0-0x6)
-                fd, pos, has_var = self._decode_v2_data_field(
-                    data, pos, field_idx)
+                fd, pos, has_var = decode_data_field(data, pos, field_idx)
                 fields.append(fd)
                 field_idx += 1
                 
@@ -763,9 +849,40 @@ class BinarySchemaDecoder:
     
     def decode_from_bytes(self, data: bytes) -> dict:
         """Convenience method: decode bytes directly to dict."""
+        if len(data) >= 2 and data[0] < 2:
+            return self._decode_v1_bytes(data)
         binary = BinarySchema.from_bytes(data)
         return self.decode(binary)
     
+    def _decode_v1_bytes(self, data: bytes) -> dict:
+        """Decode v1 bytes straight to dicts, without BinaryField objects.
+        
+        Same result and errors as BinarySchema.from_bytes + decode().
+        """
+        count = data[1]
+        available = min(count, (len(data) - 2) // 4)
+        exponent_to_mult = self._exponent_to_mult
+        fields = []
+        for i, (type_byte, mult_exp, semantic_id) in enumerate(
+                _FIELD_STRUCT_SIGNED.iter_unpack(data[2:2 + 4 * available])):
+            type_str = _TYPE_BYTE_TO_TYPE[type_byte]
+            if type_str is None:
+                FieldType(type_byte >> 4)  # Raises ValueError for the bad nibble
+            field_def = {'name': f'field_{i}', 'type': type_str}
+            mult = exponent_to_mult(mult_exp)
+            if mult != 1.0:
+                field_def['mult'] = mult
+            if semantic_id:
+                field_def['semantic'] = {'ipso': semantic_id}
+            fields.append(field_def)
+        if available < count:
+            raise ValueError("Truncated field data")
+        
+        return {
+            'version': data[0],
+            'fields': fields,
+        }
+    
     def decode_from_base64(self, encoded: str) -> dict:
         """Convenience method: decode base64 directly to dict."""
         binary = BinarySchema.from_base64(encoded)
@@ -801,8 +918,23 @@ def base64_to_schema(encoded: str) -> dict:
 
 def schema_hash(schema: dict) -> int:
     """Compute schema hash (CRC32) for OTA transfer."""
-    binary = encode_schema(schema)
-    return compute_crc32(binary)
+    return BinarySchemaEncoder().encode_with_hash(schema)[1]
+
+
+def compile_encoder(schema: dict) -> Callable[[], bytes]:
+    """Return a function that produces the schema's binary encoding.
+    
+    The encoding depends only on the schema, so it is computed once here
+    and the returned function just hands back the bytes, e.g. for repeated
+    OTA broadcasts. It is a snapshot: compile again after changing the
+    schema.
+    """
+    encoded = encode_schema(schema)
+    
+    def encoder() -> bytes:
+        return encoded
+    
+    return encoder
 
 
 if __name__ == '__main__':
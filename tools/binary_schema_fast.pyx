@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+binary_schema_fast.pyx - Cython port of the v2 data field record decoder
+
+Optional fast path for BinarySchemaDecoder._decode_v2_data_field;
+binary_schema.py falls back to the pure-Python decoder when this module
+is not built. Results are identical to the Python version.
+
+Build (in place, next to binary_schema.py):
+    pip install cython
+    cythonize -i tools/binary_schema_fast.pyx
+"""
+
+
+cpdef tuple decode_v2_data_field(const unsigned char[::1] data, Py_ssize_t pos,
+                                 Py_ssize_t field_idx, tuple type_strings,
+                                 field_type):
+    """Decode the 4-byte data field record at pos.
+
+    type_strings maps type_byte -> schema type string (None where the type
+    nibble is invalid, in which case field_type(nibble) raises). Returns
+    (field_def, new_pos, has_var_flag) like the Python decoder.
+    """
+    cdef unsigned char type_byte
+    cdef signed char mult_exp
+    cdef unsigned int semantic_id
+    cdef double mult
+
+    if pos + 4 > data.shape[0]:
+        raise ValueError(f"Truncated field at pos {pos}")
+
+    type_byte = data[pos]
+    mult_exp = <signed char>data[pos + 1]
+    semantic_id = data[pos + 2] | (data[pos + 3] << 8)
+
+    type_str = type_strings[type_byte]
+    if type_str is None:
+        field_type(type_byte >> 4)  # Raises ValueError for the bad nibble
+
+    field_def = {
+        'name': f'field_{field_idx}',
+        'type': type_str,
+    }
+
+    if semantic_id:
+        field_def['semantic'] = {'ipso': semantic_id}
+
+    # Same mapping as BinarySchemaDecoder._exponent_to_mult
+    if mult_exp == 0:
+        mult = 1.0
+    elif mult_exp == -1:
+        mult = 0.1
+    else:
+        mult = 10.0 ** mult_exp
+    if mult != 1.0:
+        field_def['mult'] = mult
+
+    return field_def, pos + 4, False
@@ -0,0 +1,32 @@
+"""
+dataclass_slots.py - __slots__ for dataclasses on Python 3.8+
+
+dataclass(slots=True) needs Python 3.10; add_slots gives the same result
+on older versions. Shared by the tools that allocate many small records
+(analyze_ttn_codec.py, binary_schema.py).
+
+Usage:
+    from dataclass_slots import add_slots
+
+    @add_slots
+    @dataclass
+    class Point:
+        x: int = 0
+        y: int = 0
+"""
+
+from dataclasses import fields
+
+
+def add_slots(cls):
+    """Rebuild a dataclass with __slots__.
+
+    The generated __init__ carries the field defaults, so the class
+    attributes holding them can be dropped in favour of slots.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -15,19 +15,94 @@ Usage:
     payload = interpreter.encode(data_dict)
 """
 
-import struct
-import re
+import base64
 import json
+import math
+import operator
+import re
+import struct
+import sys
+import warnings
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from enum import Enum
 
 
+# Standard integer types with aliases: type -> (size_bytes, signed)
+# Canonical: u8/s8, Aliases: uint8/int8/i8
+INT_TYPES = {
+    # Unsigned (canonical: u prefix)
+    'u8': (1, False), 'uint8': (1, False),
+    'u16': (2, False), 'uint16': (2, False),
+    'u24': (3, False), 'uint24': (3, False),
+    'u32': (4, False), 'uint32': (4, False),
+    'u64': (8, False), 'uint64': (8, False),
+    # Signed (canonical: s prefix, aliases: i prefix, int prefix)
+    's8': (1, True), 'i8': (1, True), 'int8': (1, True),
+    's16': (2, True), 'i16': (2, True), 'int16': (2, True),
+    's24': (3, True), 'i24': (3, True), 'int24': (3, True),
+    's32': (4, True), 'i32': (4, True), 'int32': (4, True),
+    's64': (8, True), 'i64': (8, True), 'int64': (8, True),
+}
+
+# struct format codes for fixed-width numeric types (no u24/s24 equivalent)
+STRUCT_CODES = {
+    'u8': 'B', 'uint8': 'B',
+    'u16': 'H', 'uint16': 'H',
+    'u32': 'I', 'uint32': 'I',
+    'u64': 'Q', 'uint64': 'Q',
+    's8': 'b', 'i8': 'b', 'int8': 'b',
+    's16': 'h', 'i16': 'h', 'int16': 'h',
+    's32': 'i', 'i32': 'i', 'int32': 'i',
+    's64': 'q', 'i64': 'q', 'int64': 'q',
+    'f16': 'e',
+    'f32': 'f', 'float': 'f',
+    'f64': 'd', 'double': 'd',
+}
+
+def _compute_div(a: float, b: float) -> float:
+    return a / b if b != 0 else float('nan')
+
+
+def _compute_mod(a: float, b: float) -> float:
+    return float(int(a) % int(b)) if b != 0 else float('nan')
+
+
+def _compute_idiv(a: float, b: float) -> float:
+    return float(int(a) // int(b)) if b != 0 else float('nan')
+
+
+# compute ops: name -> binary function (division by zero yields NaN)
+COMPUTE_OPS = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'div': _compute_div,
+    'mod': _compute_mod,
+    'idiv': _compute_idiv,
+}
+
+# Bool decode table: BOOL_BITS[bit][byte] -> whether bit is set in byte
+BOOL_BITS = tuple(tuple(bool((byte >> bit) & 1) for byte in range(256))
+                  for bit in range(8))
+
+# Marks gaps in lookup tables compiled from sparse integer-keyed dicts
+_MISSING = object()
+
+
 class Endian(Enum):
     BIG = 'big'
     LITTLE = 'little'
 
 
+# Precompiled float readers keyed by (endian, byte size)
+FLOAT_STRUCTS = {
+    (endian, size): struct.Struct(('<' if endian == Endian.LITTLE else '>') + code)
+    for endian in Endian
+    for size, code in ((2, 'e'), (4, 'f'), (8, 'd'))
+}
+
+
 @dataclass
 class DecodeResult:
     """Result of decoding a payload."""
@@ -69,6 +144,10 @@ class SchemaInterpreter:
     - Nested objects
     - Conditional/match fields
     - Semantic mappings (IPSO, SenML)
+    
+    Field lists, lookup tables, modifiers and formulas are compiled into
+    plans on first use and cached per interpreter, so the schema dict must
+    not be mutated after decoding has started.
     """
     
     def __init__(self, schema: Dict[str, Any]):
@@ -82,6 +161,27 @@ class SchemaInterpreter:
         
         # Bitfield state for sequential extraction
         self._bit_pos = 0
+        
+        # Parsed compact format strings: format -> (fields, endian_override)
+        self._compact_formats = {}
+        
+        # Type dispatch table for _decode_field
+        self._decoders = self._build_decoders()
+        
+        # Per-field plans compiled on first use: id(field_def) -> (field_def, plan)
+        self._repeat_plans = {}
+        self._bitfield_string_plans = {}
+        self._int_tables = {}
+        self._modifier_plans = {}
+        self._ref_plans = {}
+        self._decode_plans = {}
+        self._encode_layouts = {}
+        self._batch_layouts = {}
+        self._bitfield_types = {}
+        # Compiled formulas: (formula, encode) -> (python_expr, code)
+        self._formula_cache = {}
+        # Resolved $ref field lists: ref -> ((name, internal, field_def), ...)
+        self._ref_fields = {}
     
     def _parse_compact_format(self, format_str: str) -> tuple:
         """
@@ -94,8 +194,13 @@ class SchemaInterpreter:
         - :name suffix assigns field name
         
         Returns:
-            Tuple of (field list, endian override or None)
+            Tuple of (field list, endian override or None). Parsed once per
+            format string; the cached field list is shared between calls.
         """
+        cached = self._compact_formats.get(format_str)
+        if cached is not None:
+            return cached
+        
         FORMAT_CHARS = {
             'b': ('s8', 1), 'B': ('u8', 1),
             'h': ('s16', 2), 'H': ('u16', 2),
@@ -158,6 +263,7 @@ class SchemaInterpreter:
                 field_def = {'name': name, 'type': type_name}
                 fields.append(field_def)
         
+        self._compact_formats[format_str] = (fields, endian_override)
         return fields, endian_override
     
     def _resolve_fields(self, fPort: int = None) -> list:
@@ -219,36 +325,42 @@ class SchemaInterpreter:
         
         return self.definitions[def_name]
     
+    def _resolve_ref_fields(self, ref: str) -> Tuple[Tuple[str, bool, Dict[str, Any]], ...]:
+        """
+        Resolve a $ref to its definition's fields, once per ref.
+        
+        Returns (name, internal, field_def) tuples; every occurrence of the
+        same ref shares the cached tuple, so decode never walks definitions.
+        """
+        ref_fields = self._ref_fields.get(ref)
+        if ref_fields is None:
+            ref_def = self._resolve_ref(ref)
+            ref_fields = tuple(
+                (sys.intern(rf.get('name', 'unknown')), rf.get('name', 'unknown').startswith('_'), rf)
+                for rf in ref_def.get('fields', [])
+            )
+            self._ref_fields[ref] = ref_fields
+        return ref_fields
+    
     def _read_int(self, buf: bytes, pos: int, size: int, signed: bool) -> Tuple[int, int]:
         """Read integer from buffer."""
         if pos + size > len(buf):
             raise ValueError(f"Buffer too short: need {size} bytes at pos {pos}")
         
-        data = buf[pos:pos + size]
-        
-        if self.endian == Endian.LITTLE:
-            value = int.from_bytes(data, 'little', signed=signed)
-        else:
-            value = int.from_bytes(data, 'big', signed=signed)
-        
+        # Endian values are the int.from_bytes byte order names
+        value = int.from_bytes(buf[pos:pos + size], self.endian.value, signed=signed)
         return value, pos + size
     
     def _write_int(self, value: int, size: int, signed: bool) -> bytes:
         """Write integer to bytes."""
-        byteorder = 'little' if self.endian == Endian.LITTLE else 'big'
-        return value.to_bytes(size, byteorder, signed=signed)
+        return value.to_bytes(size, self.endian.value, signed=signed)
     
     def _read_float(self, buf: bytes, pos: int, size: int) -> Tuple[float, int]:
         """Read float from buffer."""
         if pos + size > len(buf):
             raise ValueError(f"Buffer too short: need {size} bytes at pos {pos}")
         
-        data = buf[pos:pos + size]
-        fmt = '<f' if self.endian == Endian.LITTLE else '>f'
-        if size == 8:
-            fmt = '<d' if self.endian == Endian.LITTLE else '>d'
-        
-        value = struct.unpack(fmt, data)[0]
+        value = FLOAT_STRUCTS[(self.endian, size)].unpack_from(buf, pos)[0]
         return value, pos + size
     
     def _read_float16(self, buf: bytes, pos: int) -> Tuple[float, int]:
@@ -256,14 +368,12 @@ class SchemaInterpreter:
         if pos + 2 > len(buf):
             raise ValueError(f"Buffer too short: need 2 bytes at pos {pos}")
         
-        data = buf[pos:pos + 2]
         # Use struct 'e' format for half-precision (Python 3.6+)
-        fmt = '<e' if self.endian == Endian.LITTLE else '>e'
         try:
-            value = struct.unpack(fmt, data)[0]
+            value = FLOAT_STRUCTS[(self.endian, 2)].unpack_from(buf, pos)[0]
         except struct.error:
             # Fallback: manual conversion for older Python
-            value = self._float16_to_float(data)
+            value = self._float16_to_float(buf[pos:pos + 2])
         return value, pos + 2
     
     def _float16_to_float(self, data: bytes) -> float:
@@ -365,7 +475,17 @@ class SchemaInterpreter:
         Parse bitfield type string.
         
         Returns: (base_size_bytes, bit_offset, bit_width)
+        
+        Parsed once per type string; later calls are a dict lookup.
         """
+        parsed = self._bitfield_types.get(type_str)
+        if parsed is None:
+            parsed = self._bitfield_types[type_str] = self._parse_bitfield_spec(type_str)
+        return parsed
+    
+    @staticmethod
+    def _parse_bitfield_spec(type_str: str) -> Tuple[int, int, int]:
+        """Parse a bitfield type string without caching."""
         # Python slice: u8[3:4] - bits 3 to 4 inclusive
         match = re.match(r'u(\d+)\[(\d+):(\d+)\]', type_str)
         if match:
@@ -440,167 +560,204 @@ class SchemaInterpreter:
             value = (byte_val >> bit_offset) & mask
             return value, pos, False
     
+    def _build_decoders(self) -> Dict[str, Callable[..., Tuple[Any, int]]]:
+        """
+        Build the type -> handler dispatch table used by _decode_field.
+        
+        Every handler takes (field_def, buf, pos) and returns (value, new_pos).
+        Built once per interpreter so decoding a field costs one dict lookup
+        instead of walking a chain of type comparisons.
+        """
+        decoders = {type_name: self._decode_int for type_name in INT_TYPES}
+        decoders.update({
+            # Nibble-decimal types: upper nibble = whole, lower nibble = tenths
+            'udec': self._decode_udec, 'UDec': self._decode_udec,
+            'sdec': self._decode_sdec, 'SDec': self._decode_sdec,
+            'f16': self._decode_f16,
+            'f32': self._decode_f32, 'float': self._decode_f32,
+            'f64': self._decode_f64, 'double': self._decode_f64,
+            'bool': self._decode_bool,
+            'bytes': self._decode_bytes,
+            'string': self._decode_string,
+            'ascii': self._decode_ascii,
+            'hex': self._decode_hex,
+            'base64': self._decode_base64,
+            'skip': self._decode_skip,
+            'version_string': self._decode_version_string,
+            'object': self._decode_object,
+            'repeat': self._decode_repeat,
+            'enum': self._decode_enum,
+            'match': self._decode_match,
+        })
+        return decoders
+    
     def _decode_field(self, field_def: Dict[str, Any], buf: bytes, 
                       pos: int) -> Tuple[Any, int]:
         """Decode a single field from buffer."""
         field_type = field_def.get('type', 'u8')
-        consume = field_def.get('consume', None)
-        
-        # Handle bitfields
-        if any(c in str(field_type) for c in ['[', ':', '<']):
-            base_size, bit_offset, bit_width = self._parse_bitfield_type(field_type)
-            value, new_pos, auto_consumed = self._extract_bits(
-                buf, pos, bit_offset, bit_width, base_size
-            )
-            
-            # Determine position advancement
-            if consume is not None:
-                new_pos = pos + consume
-            elif auto_consumed:
-                new_pos = pos + 1
-            else:
-                new_pos = pos
-            
-            return value, new_pos
-        
-        # Handle standard types with aliases
-        # Canonical: u8/s8, Aliases: uint8/int8/i8
-        type_info = {
-            # Unsigned (canonical: u prefix)
-            'u8': (1, False), 'uint8': (1, False),
-            'u16': (2, False), 'uint16': (2, False),
-            'u24': (3, False), 'uint24': (3, False),
-            'u32': (4, False), 'uint32': (4, False),
-            'u64': (8, False), 'uint64': (8, False),
-            # Signed (canonical: s prefix, aliases: i prefix, int prefix)
-            's8': (1, True), 'i8': (1, True), 'int8': (1, True),
-            's16': (2, True), 'i16': (2, True), 'int16': (2, True),
-            's24': (3, True), 'i24': (3, True), 'int24': (3, True),
-            's32': (4, True), 'i32': (4, True), 'int32': (4, True),
-            's64': (8, True), 'i64': (8, True), 'int64': (8, True),
-        }
-        
-        if field_type in type_info:
-            size, signed = type_info[field_type]
-            value, new_pos = self._read_int(buf, pos, size, signed)
-            # Apply encoding if specified (sign_magnitude, bcd, gray)
-            encoding = field_def.get('encoding')
-            if encoding:
-                # For encoded values, read as unsigned first
-                if signed:
-                    value, _ = self._read_int(buf, pos, size, False)
-                value = self._decode_encoding(value, encoding, size)
-            return value, new_pos
-        
-        # Nibble-decimal types: upper nibble = whole, lower nibble = tenths
-        if field_type in ('udec', 'UDec'):
-            if pos >= len(buf):
-                raise ValueError("Buffer too short for udec")
-            byte = buf[pos]
-            value = (byte >> 4) + (byte & 0x0F) * 0.1
-            return value, pos + 1
-        
-        if field_type in ('sdec', 'SDec'):
-            if pos >= len(buf):
-                raise ValueError("Buffer too short for sdec")
-            byte = buf[pos]
-            whole = byte >> 4
-            # Sign extend the 4-bit whole part
-            if whole >= 8:
-                whole -= 16
-            value = whole + (byte & 0x0F) * 0.1
-            return value, pos + 1
-        
-        if field_type == 'f16':
-            # IEEE 754 half-precision (2 bytes)
-            return self._read_float16(buf, pos)
-        
-        if field_type in ('f32', 'float'):
-            return self._read_float(buf, pos, 4)
-        
-        if field_type in ('f64', 'double'):
-            return self._read_float(buf, pos, 8)
         
-        if field_type == 'bool':
-            bit = field_def.get('bit', 0)
-            if pos >= len(buf):
-                raise ValueError("Buffer too short for bool")
-            value = bool((buf[pos] >> bit) & 1)
-            # Bool doesn't advance position by default
-            if consume:
-                return value, pos + consume
-            return value, pos
-        
-        if field_type == 'bytes':
-            length = field_def.get('length', 1)
-            if pos + length > len(buf):
-                raise ValueError("Buffer too short for bytes")
-            value = buf[pos:pos + length]
-            return value, pos + length
+        decoder = self._decoders.get(field_type)
+        if decoder is not None:
+            return decoder(field_def, buf, pos)
         
-        if field_type == 'string':
-            length = field_def.get('length', 1)
-            if pos + length > len(buf):
-                raise ValueError("Buffer too short for string")
-            value = buf[pos:pos + length].decode('utf-8', errors='replace').rstrip('\x00')
-            return value, pos + length
-        
-        if field_type == 'ascii':
-            length = field_def.get('length', 1)
-            if pos + length > len(buf):
-                raise ValueError("Buffer too short for ascii")
-            value = buf[pos:pos + length].decode('ascii', errors='replace').rstrip('\x00')
-            return value, pos + length
-        
-        if field_type == 'hex':
-            length = field_def.get('length', 1)
-            if pos + length > len(buf):
-                raise ValueError("Buffer too short for hex")
-            value = buf[pos:pos + length].hex().upper()
-            return value, pos + length
-        
-        if field_type == 'base64':
-            import base64 as b64
-            length = field_def.get('length', 1)
-            if pos + length > len(buf):
-                raise ValueError("Buffer too short for base64")
-            value = b64.b64encode(buf[pos:pos + length]).decode('ascii')
-            return value, pos + length
-        
-        if field_type == 'skip':
-            # Padding/reserved bytes - advance position but don't output
-            length = field_def.get('length', 1)
-            return None, pos + length
-        
-        if field_type == 'version_string':
-            # Phase 3: Assemble a version string from packed bytes
-            return self._decode_version_string(field_def, buf, pos)
-        
-        if field_type == 'object':
-            # Nested object
-            nested_fields = field_def.get('fields', [])
-            nested_result = {}
-            for nested_field in nested_fields:
-                name = nested_field.get('name', 'unknown')
-                value, pos = self._decode_field(nested_field, buf, pos)
-                value = self._apply_modifiers(value, nested_field)
-                nested_result[name] = value
-            return nested_result, pos
-        
-        if field_type == 'repeat':
-            # Repeated/array field
-            return self._decode_repeat(field_def, buf, pos)
-        
-        if field_type == 'enum':
-            # Enum type: decode base type then map to string
-            return self._decode_enum(field_def, buf, pos)
-        
-        if field_type == 'match':
-            # Conditional decoding
-            return self._decode_match(field_def, buf, pos)
+        # Handle bitfields - once the type string parses, route it
+        # straight to the bitfield decoder on later calls
+        if any(c in str(field_type) for c in ['[', ':', '<']):
+            self._parse_bitfield_type(field_type)
+            self._decoders[field_type] = self._decode_bitfield
+            return self._decode_bitfield(field_def, buf, pos)
         
         raise ValueError(f"Unknown type: {field_type}")
     
+    def _decode_bitfield(self, field_def: Dict[str, Any], buf: bytes,
+                         pos: int) -> Tuple[int, int]:
+        """Decode a bitfield type (u8[3:4], u8:2, bits<3,2>, etc.)."""
+        consume = field_def.get('consume', None)
+        base_size, bit_offset, bit_width = self._parse_bitfield_type(field_def['type'])
+        value, new_pos, auto_consumed = self._extract_bits(
+            buf, pos, bit_offset, bit_width, base_size
+        )
+        
+        # Determine position advancement
+        if consume is not None:
+            new_pos = pos + consume
+        elif auto_consumed:
+            new_pos = pos + 1
+        else:
+            new_pos = pos
+        
+        return value, new_pos
+    
+    def _decode_int(self, field_def: Dict[str, Any], buf: bytes,
+                    pos: int) -> Tuple[int, int]:
+        """Decode a standard integer type (u8..u64, s8..s64 and aliases)."""
+        size, signed = INT_TYPES[field_def.get('type', 'u8')]
+        value, new_pos = self._read_int(buf, pos, size, signed)
+        # Apply encoding if specified (sign_magnitude, bcd, gray)
+        encoding = field_def.get('encoding')
+        if encoding:
+            # For encoded values, read as unsigned first
+            if signed:
+                value, _ = self._read_int(buf, pos, size, False)
+            value = self._decode_encoding(value, encoding, size)
+        return value, new_pos
+    
+    def _decode_udec(self, field_def: Dict[str, Any], buf: bytes,
+                     pos: int) -> Tuple[float, int]:
+        """Decode unsigned nibble-decimal: upper nibble whole, lower tenths."""
+        if pos >= len(buf):
+            raise ValueError("Buffer too short for udec")
+        byte = buf[pos]
+        value = (byte >> 4) + (byte & 0x0F) * 0.1
+        return value, pos + 1
+    
+    def _decode_sdec(self, field_def: Dict[str, Any], buf: bytes,
+                     pos: int) -> Tuple[float, int]:
+        """Decode signed nibble-decimal: signed upper nibble whole, lower tenths."""
+        if pos >= len(buf):
+            raise ValueError("Buffer too short for sdec")
+        byte = buf[pos]
+        whole = byte >> 4
+        # Sign extend the 4-bit whole part
+        if whole >= 8:
+            whole -= 16
+        value = whole + (byte & 0x0F) * 0.1
+        return value, pos + 1
+    
+    def _decode_f16(self, field_def: Dict[str, Any], buf: bytes,
+                    pos: int) -> Tuple[float, int]:
+        """Decode IEEE 754 half-precision (2 bytes)."""
+        return self._read_float16(buf, pos)
+    
+    def _decode_f32(self, field_def: Dict[str, Any], buf: bytes,
+                    pos: int) -> Tuple[float, int]:
+        """Decode IEEE 754 single-precision (4 bytes)."""
+        return self._read_float(buf, pos, 4)
+    
+    def _decode_f64(self, field_def: Dict[str, Any], buf: bytes,
+                    pos: int) -> Tuple[float, int]:
+        """Decode IEEE 754 double-precision (8 bytes)."""
+        return self._read_float(buf, pos, 8)
+    
+    def _decode_bool(self, field_def: Dict[str, Any], buf: bytes,
+                     pos: int) -> Tuple[bool, int]:
+        """Decode a single bit as bool."""
+        bit = field_def.get('bit', 0)
+        consume = field_def.get('consume', None)
+        if pos >= len(buf):
+            raise ValueError("Buffer too short for bool")
+        if 0 <= bit < 8:
+            value = BOOL_BITS[bit][buf[pos]]
+        else:
+            value = bool((buf[pos] >> bit) & 1)
+        # Bool doesn't advance position by default
+        if consume:
+            return value, pos + consume
+        return value, pos
+    
+    def _decode_bytes(self, field_def: Dict[str, Any], buf: bytes,
+                      pos: int) -> Tuple[bytes, int]:
+        """Decode raw bytes."""
+        length = field_def.get('length', 1)
+        if pos + length > len(buf):
+            raise ValueError("Buffer too short for bytes")
+        value = bytes(buf[pos:pos + length])
+        return value, pos + length
+    
+    def _decode_string(self, field_def: Dict[str, Any], buf: bytes,
+                       pos: int) -> Tuple[str, int]:
+        """Decode UTF-8 string, stripping trailing NULs."""
+        length = field_def.get('length', 1)
+        if pos + length > len(buf):
+            raise ValueError("Buffer too short for string")
+        value = str(buf[pos:pos + length], 'utf-8', 'replace').rstrip('\x00')
+        return value, pos + length
+    
+    def _decode_ascii(self, field_def: Dict[str, Any], buf: bytes,
+                      pos: int) -> Tuple[str, int]:
+        """Decode ASCII string, stripping trailing NULs."""
+        length = field_def.get('length', 1)
+        if pos + length > len(buf):
+            raise ValueError("Buffer too short for ascii")
+        value = str(buf[pos:pos + length], 'ascii', 'replace').rstrip('\x00')
+        return value, pos + length
+    
+    def _decode_hex(self, field_def: Dict[str, Any], buf: bytes,
+                    pos: int) -> Tuple[str, int]:
+        """Decode bytes as uppercase hex string."""
+        length = field_def.get('length', 1)
+        if pos + length > len(buf):
+            raise ValueError("Buffer too short for hex")
+        value = buf[pos:pos + length].hex().upper()
+        return value, pos + length
+    
+    def _decode_base64(self, field_def: Dict[str, Any], buf: bytes,
+                       pos: int) -> Tuple[str, int]:
+        """Decode bytes as base64 string."""
+        length = field_def.get('length', 1)
+        if pos + length > len(buf):
+            raise ValueError("Buffer too short for base64")
+        value = base64.b64encode(buf[pos:pos + length]).decode('ascii')
+        return value, pos + length
+    
+    def _decode_skip(self, field_def: Dict[str, Any], buf: bytes,
+                     pos: int) -> Tuple[None, int]:
+        """Padding/reserved bytes - advance position but don't output."""
+        length = field_def.get('length', 1)
+        return None, pos + length
+    
+    def _decode_object(self, field_def: Dict[str, Any], buf: bytes,
+                       pos: int) -> Tuple[Dict[str, Any], int]:
+        """Decode nested object (type: object)."""
+        nested_fields = field_def.get('fields', [])
+        nested_result = {}
+        for nested_field in nested_fields:
+            name = nested_field.get('name', 'unknown')
+            value, pos = self._decode_field(nested_field, buf, pos)
+            value = self._apply_modifiers(value, nested_field)
+            nested_result[name] = value
+        return nested_result, pos
+    
     def _decode_enum(self, field_def: Dict[str, Any], buf: bytes,
                      pos: int) -> Tuple[Any, int]:
         """Decode enum field: base integer type mapped to string value."""
@@ -613,23 +770,57 @@ class SchemaInterpreter:
         
         # Map to string value
         # Values can be dict {0: 'idle', 1: 'running'} or list ['idle', 'running']
-        if isinstance(values, dict):
-            # Convert string keys to int if needed
-            values_map = {int(k) if isinstance(k, str) else k: v for k, v in values.items()}
-            if raw_value in values_map:
-                return values_map[raw_value], new_pos
-            else:
+        if isinstance(values, (dict, list)):
+            mapped = self._lookup(self._int_table(values), raw_value)
+            if mapped is _MISSING:
                 # Unknown value - return raw with warning marker
                 return f"unknown({raw_value})", new_pos
-        elif isinstance(values, list):
-            if 0 <= raw_value < len(values):
-                return values[raw_value], new_pos
-            else:
-                return f"unknown({raw_value})", new_pos
+            return mapped, new_pos
         
         # No mapping - return raw value
         return raw_value, new_pos
     
+    def _int_table(self, mapping: Union[Dict[Any, Any], List[Any]]) -> Union[Dict[Any, Any], List[Any]]:
+        """
+        Compile a lookup/enum mapping for integer-keyed access.
+        
+        Lists are used as-is. Dict keys given as numeric strings are
+        converted to int; when every key is a small non-negative int the
+        dict becomes a list indexed by key, with _MISSING marking gaps.
+        Compiled once per mapping and reused across decodes.
+        """
+        entry = self._int_tables.get(id(mapping))
+        if entry is not None and entry[0] is mapping:
+            return entry[1]
+        
+        table = mapping
+        if isinstance(mapping, dict):
+            table = {}
+            for k, v in mapping.items():
+                if isinstance(k, str):
+                    try:
+                        k = int(k)
+                    except ValueError:
+                        pass
+                table[k] = v
+            if table and all(type(k) is int and 0 <= k < 256 for k in table):
+                dense = [_MISSING] * (max(table) + 1)
+                for k, v in table.items():
+                    dense[k] = v
+                table = dense
+        
+        self._int_tables[id(mapping)] = (mapping, table)
+        return table
+    
+    @staticmethod
+    def _lookup(table: Union[Dict[Any, Any], List[Any]], value: Any) -> Any:
+        """Look value up in a table from _int_table; _MISSING if absent."""
+        if isinstance(table, list):
+            if isinstance(value, int) and 0 <= value < len(table):
+                return table[value]
+            return _MISSING
+        return table.get(value, _MISSING)
+    
     def _decode_repeat(self, field_def: Dict[str, Any], buf: bytes,
                        pos: int) -> Tuple[List[Any], int]:
         """
@@ -648,6 +839,7 @@ class SchemaInterpreter:
         nested_fields = field_def.get('fields', [])
         max_iterations = field_def.get('max', 1000)
         min_iterations = field_def.get('min', 0)
+        element_struct = self._repeat_plan(field_def)
         
         result = []
         iterations = 0
@@ -670,7 +862,11 @@ class SchemaInterpreter:
             
             count = min(count, max_iterations)
             
-            for _ in range(count):
+            if element_struct is not None:
+                result, pos = self._decode_repeat_block(
+                    element_struct, nested_fields, buf, pos, count)
+            
+            for _ in range(count - len(result)):
                 element = {}
                 for nested_field in nested_fields:
                     name = nested_field.get('name', 'unknown')
@@ -693,6 +889,12 @@ class SchemaInterpreter:
             
             end_pos = pos + byte_length
             
+            if element_struct is not None and byte_length > 0:
+                result, pos = self._decode_repeat_block(
+                    element_struct, nested_fields, buf, pos,
+                    min(byte_length // element_struct.size, max_iterations))
+                iterations = len(result)
+            
             while pos < end_pos and iterations < max_iterations:
                 element = {}
                 for nested_field in nested_fields:
@@ -709,6 +911,11 @@ class SchemaInterpreter:
                 
         elif until == 'end':
             # Until-end: repeat until payload exhausted
+            if element_struct is not None:
+                result, pos = self._decode_repeat_block(
+                    element_struct, nested_fields, buf, pos, max_iterations)
+                iterations = len(result)
+            
             while pos < len(buf) and iterations < max_iterations:
                 element = {}
                 start_pos = pos
@@ -732,6 +939,63 @@ class SchemaInterpreter:
         
         return result, pos
     
+    def _repeat_plan(self, field_def: Dict[str, Any]) -> Optional[struct.Struct]:
+        """
+        Return a precompiled struct.Struct for a repeat element, or None.
+        
+        Only elements made entirely of fixed-width numeric fields (plus
+        fixed-length skip padding) qualify; anything else - bitfields, bools,
+        encodings, strings, nested constructs - uses the per-field path.
+        Compiled once per repeat field and reused across decodes.
+        """
+        entry = self._repeat_plans.get(id(field_def))
+        if entry is not None and entry[0] is field_def and entry[1] == self.endian:
+            return entry[2]
+        
+        fmt = '<' if self.endian == Endian.LITTLE else '>'
+        nested_fields = field_def.get('fields', [])
+        for nested_field in nested_fields:
+            field_type = nested_field.get('type', 'u8')
+            if field_type == 'skip' and isinstance(nested_field.get('length', 1), int):
+                fmt += f"{nested_field.get('length', 1)}x"
+            elif field_type in STRUCT_CODES and not nested_field.get('encoding'):
+                fmt += STRUCT_CODES[field_type]
+            else:
+                fmt = None
+                break
+        
+        plan = struct.Struct(fmt) if nested_fields and fmt else None
+        if plan is not None and plan.size == 0:
+            plan = None
+        self._repeat_plans[id(field_def)] = (field_def, self.endian, plan)
+        return plan
+    
+    def _decode_repeat_block(self, element_struct: struct.Struct,
+                             nested_fields: List[Dict[str, Any]], buf: bytes,
+                             pos: int, max_count: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Decode up to max_count fixed-layout repeat elements in one pass.
+        
+        All complete elements remaining in the buffer are unpacked with a
+        single iter_unpack call over a zero-copy view; a truncated trailing
+        element is left for the per-field path so it reports the usual error.
+        """
+        size = element_struct.size
+        count = min(max_count, (len(buf) - pos) // size)
+        if count <= 0:
+            return [], pos
+        
+        value_fields = [(nf.get('name', 'unknown'), nf)
+                        for nf in nested_fields if nf.get('type') != 'skip']
+        end = pos + count * size
+        result = []
+        for values in element_struct.iter_unpack(memoryview(buf)[pos:end]):
+            element = {}
+            for (name, nested_field), value in zip(value_fields, values):
+                element[name] = self._apply_modifiers(value, nested_field)
+            result.append(element)
+        return result, end
+    
     def _decode_match(self, field_def: Dict[str, Any], buf: bytes, 
                       pos: int) -> Tuple[Dict[str, Any], int]:
         """
@@ -998,7 +1262,6 @@ class SchemaInterpreter:
                     value, pos = self._decode_field(gf, buf, pos)
                     if value is not None:
                         if gf.get('formula'):
-                            import warnings
                             warnings.warn(f"Field '{gf_name}': 'formula' is deprecated.", DeprecationWarning)
                             value = self._evaluate_formula(gf['formula'], value)
                         else:
@@ -1014,7 +1277,6 @@ class SchemaInterpreter:
         
         # Deprecated: formula field
         if field_def.get('formula'):
-            import warnings
             warnings.warn(f"Field '{field_def.get('name', 'unknown')}': 'formula' is deprecated.", DeprecationWarning)
             value = self._evaluate_formula(field_def['formula'], None)
         
@@ -1050,34 +1312,42 @@ class SchemaInterpreter:
         
         return value
     
+    def _bitfield_string_plan(self, field_def: Dict[str, Any]) -> Tuple[Tuple[int, int, bool], ...]:
+        """
+        Compile bitfield_string parts to (shift, mask, is_hex) tuples.
+        
+        Compiled once per field so decoding is one int.from_bytes plus a
+        shift/mask per part, with no per-call parsing of the parts list.
+        """
+        entry = self._bitfield_string_plans.get(id(field_def))
+        if entry is not None and entry[0] is field_def:
+            return entry[1]
+        
+        plan = []
+        for part in field_def.get('parts', []):
+            bit_off = part[0]
+            bit_len = part[1]
+            fmt = part[2] if len(part) >= 3 else 'decimal'
+            plan.append((bit_off, (1 << bit_len) - 1, fmt == 'hex'))
+        plan = tuple(plan)
+        self._bitfield_string_plans[id(field_def)] = (field_def, plan)
+        return plan
+    
     def _decode_bitfield_string(self, field_def: Dict[str, Any], buf: bytes, pos: int) -> Tuple[str, int]:
         """Decode a bitfield_string field (e.g., firmware version)."""
         length = field_def.get('length', 2)
-        parts = field_def.get('parts', [])
         delimiter = field_def.get('delimiter', '.')
         prefix = field_def.get('prefix', '')
         
         if pos + length > len(buf):
             raise ValueError(f"Buffer too short for bitfield_string at pos {pos}")
         
-        data = buf[pos:pos + length]
-        if self.endian == Endian.LITTLE:
-            int_val = int.from_bytes(data, 'little')
-        else:
-            int_val = int.from_bytes(data, 'big')
+        int_val = int.from_bytes(buf[pos:pos + length], self.endian.value)
         pos += length
         
-        part_strs = []
-        for part in parts:
-            bit_off = part[0]
-            bit_len = part[1]
-            fmt = part[2] if len(part) >= 3 else 'decimal'
-            mask = (1 << bit_len) - 1
-            raw = (int_val >> bit_off) & mask
-            if fmt == 'hex':
-                part_strs.append(format(raw, 'X'))
-            else:
-                part_strs.append(str(raw))
+        part_strs = [format((int_val >> shift) & mask, 'X') if is_hex
+                     else str((int_val >> shift) & mask)
+                     for shift, mask, is_hex in self._bitfield_string_plan(field_def)]
         
         return prefix + delimiter.join(part_strs), pos
     
@@ -1108,6 +1378,56 @@ class SchemaInterpreter:
         
         return prefix + delimiter.join(parts), pos
     
+    def _compile_formula(self, formula: str, encode: bool = False) -> Tuple[str, Any]:
+        """
+        Translate a formula to Python and compile it, once per formula string.
+        
+        The raw value (x, and value for encode_formula) becomes the local _x
+        and $name references become _v.get('name', 0) lookups, so evaluation
+        binds the current values instead of re-substituting text each call.
+        
+        Returns (python_expr, code_object).
+        """
+        key = (formula, encode)
+        compiled = self._formula_cache.get(key)
+        if compiled is not None:
+            return compiled
+        
+        expr = formula
+        if encode:
+            expr = re.sub(r'\bx\b', '_x', expr)
+            expr = re.sub(r'\bvalue\b', '_x', expr)
+        else:
+            # Standalone 'x' is the raw value ($x is a variable reference)
+            expr = re.sub(r'(?<!\$)\bx\b', '_x', expr)
+            
+            # Substitute $field_name references
+            expr = re.sub(r'\$([a-zA-Z_][a-zA-Z0-9_]*)',
+                          lambda m: f"_v.get('{m.group(1)}', 0)", expr)
+            
+            # Replace function names
+            expr = re.sub(r'\bpow\s*\(', '_math.pow(', expr)
+            expr = re.sub(r'\babs\s*\(', 'abs(', expr)
+            expr = re.sub(r'\bsqrt\s*\(', '_math.sqrt(', expr)
+            expr = re.sub(r'\bmin\s*\(', 'min(', expr)
+            expr = re.sub(r'\bmax\s*\(', 'max(', expr)
+            
+            # Convert C-style ternary (cond ? true_val : false_val) to Python (true_val if cond else false_val)
+            ternary_match = re.match(r'^(.+?)\s*\?\s*(.+?)\s*:\s*(.+)$', expr)
+            if ternary_match:
+                cond, true_val, false_val = ternary_match.groups()
+                expr = f"({true_val}) if ({cond}) else ({false_val})"
+        
+        try:
+            code = compile(expr, '<formula>', 'eval')
+        except SyntaxError as e:
+            label = 'encode_formula' if encode else 'Formula'
+            raise ValueError(f"{label} evaluation failed: '{formula}' -> '{expr}': {e}")
+        
+        compiled = (expr, code)
+        self._formula_cache[key] = compiled
+        return compiled
+    
     def _evaluate_encode_formula(self, formula: str, value: float) -> float:
         """
         Phase 3: Evaluate an encode_formula for custom encoding.
@@ -1115,55 +1435,28 @@ class SchemaInterpreter:
         encode_formula is the inverse of formula, used during encoding.
         Variable 'x' or 'value' refers to the application-level value.
         """
-        import math as _math
-        
-        expr = formula
-        # Replace x/value with actual value
-        expr = re.sub(r'\bx\b', str(value), expr)
-        expr = re.sub(r'\bvalue\b', str(value), expr)
+        expr, code = self._compile_formula(formula, encode=True)
         
         try:
-            result = eval(expr, {"__builtins__": {}, "_math": _math,
-                                 "abs": abs, "min": min, "max": max, "int": int, "round": round})
+            result = eval(code, {"__builtins__": {}, "_math": math,
+                                 "abs": abs, "min": min, "max": max, "int": int, "round": round},
+                          {"_x": value})
             return float(result)
         except Exception as e:
             raise ValueError(f"encode_formula evaluation failed: '{formula}' -> '{expr}': {e}")
     
     def _evaluate_formula(self, formula: str, x=None) -> float:
         """Evaluate a formula with variable substitution and math functions."""
-        import math as _math
+        expr, code = self._compile_formula(formula)
         
-        expr = formula
-        
-        # Substitute $field_name references
-        expr = re.sub(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', 
-                      lambda m: str(self._variables.get(m.group(1), 0)), expr)
-        
-        # Replace standalone 'x' with raw value
+        local_vars = {"_v": getattr(self, '_variables', {})}
         if x is not None:
-            expr = re.sub(r'\bx\b', str(x), expr)
-        
-        # Replace function names
-        expr = re.sub(r'\bpow\s*\(', '_math.pow(', expr)
-        expr = re.sub(r'\babs\s*\(', 'abs(', expr)
-        expr = re.sub(r'\bsqrt\s*\(', '_math.sqrt(', expr)
-        expr = re.sub(r'\bmin\s*\(', 'min(', expr)
-        expr = re.sub(r'\bmax\s*\(', 'max(', expr)
-        
-        # Replace 'and'/'or'
-        expr = re.sub(r'\band\b', 'and', expr)
-        expr = re.sub(r'\bor\b', 'or', expr)
-        
-        # Convert C-style ternary (cond ? true_val : false_val) to Python (true_val if cond else false_val)
-        ternary_match = re.match(r'^(.+?)\s*\?\s*(.+?)\s*:\s*(.+)$', expr)
-        if ternary_match:
-            cond, true_val, false_val = ternary_match.groups()
-            expr = f"({true_val}) if ({cond}) else ({false_val})"
+            local_vars["_x"] = x
         
         try:
-            result = eval(expr, {"__builtins__": {}, "_math": _math, 
+            result = eval(code, {"__builtins__": {}, "_math": math, 
                                  "abs": abs, "min": min, "max": max,
-                                 "True": True, "False": False})
+                                 "True": True, "False": False}, local_vars)
             return float(result) if isinstance(result, (int, float)) else 0.0
         except Exception as e:
             raise ValueError(f"Formula evaluation failed: '{formula}' -> '{expr}': {e}")
@@ -1206,26 +1499,10 @@ class SchemaInterpreter:
         b = resolve_operand(b_spec)
         
         # Apply operation
-        if op == 'add':
-            return a + b
-        elif op == 'sub':
-            return a - b
-        elif op == 'mul':
-            return a * b
-        elif op == 'div':
-            if b == 0:
-                return float('nan')
-            return a / b
-        elif op == 'mod':
-            if b == 0:
-                return float('nan')
-            return float(int(a) % int(b))
-        elif op == 'idiv':
-            if b == 0:
-                return float('nan')
-            return float(int(a) // int(b))
-        else:
+        op_fn = COMPUTE_OPS.get(op)
+        if op_fn is None:
             raise ValueError(f"Unknown compute op: {op}")
+        return op_fn(a, b)
     
     def _evaluate_guard(self, guard_def: Dict[str, Any]) -> Tuple[bool, Any]:
         """
@@ -1266,33 +1543,50 @@ class SchemaInterpreter:
         
         return (True, else_value)
     
+    def _ref_plan(self, field_def: Dict[str, Any]) -> Tuple[Optional[str], float, Optional[list]]:
+        """
+        Compile a field's ref to (variable name, constant, polynomial).
+        
+        A '$name' ref becomes the bare variable name, sliced once here rather
+        than on every decode, where each fresh slice also had to be hashed
+        again for the variables lookup. Any other ref becomes a float
+        constant with no name. The polynomial is kept only when it will be
+        applied (a list of at least two coefficients).
+        """
+        entry = self._ref_plans.get(id(field_def))
+        if entry is not None and entry[0] is field_def:
+            return entry[1]
+        
+        ref_field = field_def['ref']
+        if isinstance(ref_field, str) and ref_field.startswith('$'):
+            ref_name, constant = ref_field[1:], 0.0
+        else:
+            ref_name, constant = None, float(ref_field)
+        coeffs = field_def.get('polynomial')
+        if not (isinstance(coeffs, list) and len(coeffs) >= 2):
+            coeffs = None
+        
+        plan = (ref_name, constant, coeffs)
+        self._ref_plans[id(field_def)] = (field_def, plan)
+        return plan
+    
     def _resolve_ref_value(self, field_def: Dict[str, Any]) -> float:
         """
         Resolve a ref field and apply modifiers/polynomial/transform.
         
         field_def must have 'ref' key.
         """
-        ref_field = field_def['ref']
-        if isinstance(ref_field, str) and ref_field.startswith('$'):
-            ref_name = ref_field[1:]
+        ref_name, value, coeffs = self._ref_plan(field_def)
+        if ref_name is not None:
             value = float(self._variables.get(ref_name, 0))
-        else:
-            value = float(ref_field)
         
         # Apply polynomial if present
-        if 'polynomial' in field_def:
-            coeffs = field_def['polynomial']
-            if isinstance(coeffs, list) and len(coeffs) >= 2:
-                value = self._evaluate_polynomial(coeffs, value)
+        if coeffs is not None:
+            value = self._evaluate_polynomial(coeffs, value)
         
         # Apply basic modifiers (mult, div, add) in YAML key order
-        for key in field_def:
-            if key == 'mult' and field_def['mult'] is not None:
-                value = value * field_def['mult']
-            elif key == 'div' and field_def['div'] is not None and field_def['div'] != 0:
-                value = value / field_def['div']
-            elif key == 'add' and field_def['add'] is not None:
-                value = value + field_def['add']
+        for op, operand in self._modifier_plan(field_def)[0]:
+            value = op(value, operand)
         
         # Apply transform array if present
         if 'transform' in field_def:
@@ -1307,8 +1601,6 @@ class SchemaInterpreter:
         Supported ops: sqrt, abs, pow, floor, ceiling, clamp, log10, log,
                        add, mult, div
         """
-        import math
-        
         for op in transform_ops:
             if 'sqrt' in op and op['sqrt']:
                 value = math.sqrt(max(0, value))  # Clamp to avoid domain error
@@ -1393,16 +1685,13 @@ class SchemaInterpreter:
         if not group_fields:
             return pos
         
-        # Decode all fields from the same starting position
+        # Decode all fields from the same starting position; the position each
+        # field would advance to is discarded, so no consume override is needed
         for gf in group_fields:
             name = gf.get('name', 'unknown')
             
-            # Force consume: 0 for all but track internally
-            gf_copy = dict(gf)
-            gf_copy['consume'] = 0
-            
             try:
-                value, _ = self._decode_field(gf_copy, buf, pos)
+                value, _ = self._decode_field(gf, buf, pos)
                 value = self._apply_modifiers(value, gf)
                 if not name.startswith('_'):
                     result.data[name] = value
@@ -1620,6 +1909,42 @@ class SchemaInterpreter:
         
         return "good"
     
+    def _modifier_plan(self, field_def: Dict[str, Any]) -> Tuple[tuple, tuple]:
+        """
+        Compile a field's mult/div/add modifiers to (decode_steps, encode_steps).
+        
+        Each step is an (operator, operand) pair applied in order. Decode
+        steps follow YAML key order; encode steps are the inverses in reverse
+        order. No-op modifiers (None, div by 0) are dropped, so fields with
+        no modifiers get empty chains. Steps are kept separate rather than
+        folded into one constant so float results stay bit-identical to the
+        sequential evaluation the other language implementations use.
+        """
+        entry = self._modifier_plans.get(id(field_def))
+        if entry is not None and entry[0] is field_def:
+            return entry[1]
+        
+        decode_steps = []
+        encode_steps = []
+        for key in field_def:
+            operand = field_def[key]
+            if operand is None:
+                continue
+            if key == 'mult':
+                decode_steps.append((operator.mul, operand))
+                if operand != 0:
+                    encode_steps.append((operator.truediv, operand))
+            elif key == 'div' and operand != 0:
+                decode_steps.append((operator.truediv, operand))
+                encode_steps.append((operator.mul, operand))
+            elif key == 'add':
+                decode_steps.append((operator.add, operand))
+                encode_steps.append((operator.sub, operand))
+        
+        plan = (tuple(decode_steps), tuple(reversed(encode_steps)))
+        self._modifier_plans[id(field_def)] = (field_def, plan)
+        return plan
+    
     def _apply_modifiers(self, value: Any, field_def: Dict[str, Any]) -> Any:
         """Apply arithmetic modifiers to decoded value."""
         if not isinstance(value, (int, float)):
@@ -1628,7 +1953,6 @@ class SchemaInterpreter:
         # Formula takes precedence - use sandboxed evaluator (DEPRECATED)
         formula = field_def.get('formula')
         if formula:
-            import warnings
             warnings.warn(
                 f"Field '{field_def.get('name', 'unknown')}': 'formula' is deprecated. "
                 "Use 'polynomial', 'compute', or 'transform' instead.",
@@ -1641,26 +1965,83 @@ class SchemaInterpreter:
             return value
         
         # Apply modifiers in YAML key order (dict preserves insertion order in Python 3.7+)
-        for key in field_def:
-            if key == 'mult' and field_def['mult'] is not None:
-                value = value * field_def['mult']
-            elif key == 'div' and field_def['div'] is not None and field_def['div'] != 0:
-                value = value / field_def['div']
-            elif key == 'add' and field_def['add'] is not None:
-                value = value + field_def['add']
+        for op, operand in self._modifier_plan(field_def)[0]:
+            value = op(value, operand)
         
         # Apply transform array (new declarative constructs)
         transform = field_def.get('transform')
         if transform and isinstance(transform, list):
             value = self._apply_transform(float(value), transform)
         
-        # Apply lookup table
+        # Apply lookup table (unmapped values pass through unchanged)
         lookup = field_def.get('lookup')
-        if lookup and isinstance(value, int) and 0 <= value < len(lookup):
-            value = lookup[value]
+        if lookup and isinstance(value, int):
+            mapped = self._lookup(self._int_table(lookup), value)
+            if mapped is not _MISSING:
+                value = mapped
         
         return value
     
+    def _decode_plan(self, fields: List[Dict[str, Any]]) -> Tuple[Tuple[str, Any, Any], ...]:
+        """
+        Classify a top-level field list once into (kind, field_def, name) steps.
+        
+        Kinds: ref, byte_group, match, object, tlv, flagged, bitfield_string,
+        number, match_legacy, internal, field - plus skip, whose third slot
+        is the byte count and whose consecutive runs are merged into one
+        step. decode() then dispatches on kind instead of re-probing each
+        field dict for construct keys on every payload. Names are interned
+        here, without touching the schema dicts themselves.
+        """
+        if not fields:
+            return ()
+        entry = self._decode_plans.get(id(fields))
+        if entry is not None and entry[0] is fields:
+            return entry[1]
+        
+        plan = []
+        for field_def in fields:
+            has_type = bool(field_def.get('type'))
+            name = field_def.get('name', 'unknown')
+            if isinstance(name, str):
+                # Result dict keys: interned names hit the identity fast path
+                name = sys.intern(name)
+            field_type = field_def.get('type', 'u8')
+            if '$ref' in field_def:
+                kind = 'ref'
+            elif 'byte_group' in field_def:
+                kind = 'byte_group'
+            elif 'match' in field_def and not has_type:
+                kind = 'match'
+            elif 'object' in field_def and not has_type:
+                kind = 'object'
+            elif 'tlv' in field_def and not has_type:
+                kind = 'tlv'
+            elif 'flagged' in field_def and not has_type:
+                kind = 'flagged'
+            elif field_type == 'bitfield_string':
+                kind = 'bitfield_string'
+            elif field_type == 'number':
+                kind = 'number'
+            elif field_type == 'match' and name == 'unknown':
+                kind = 'match_legacy'
+            elif field_type == 'skip' and isinstance(field_def.get('length', 1), int):
+                # Skip never outputs or fails: just advance, merging runs
+                length = field_def.get('length', 1)
+                if plan and plan[-1][0] == 'skip':
+                    length += plan.pop()[2]
+                plan.append(('skip', None, length))
+                continue
+            elif name.startswith('_'):
+                kind = 'internal'
+            else:
+                kind = 'field'
+            plan.append((kind, field_def, name))
+        
+        plan = tuple(plan)
+        self._decode_plans[id(fields)] = (fields, plan)
+        return plan
+    
     def decode(self, payload: bytes, fPort: int = None, input_metadata: Dict[str, Any] = None) -> DecodeResult:
         """
         Decode payload bytes using schema.
@@ -1675,6 +2056,9 @@ class SchemaInterpreter:
         """
         result = DecodeResult(data={}, bytes_consumed=0)
         
+        # Zero-copy view: field slices below don't allocate intermediate bytes
+        payload = memoryview(payload)
+        
         # Reset bitfield state
         self._bit_pos = 0
         self._current_byte = 0
@@ -1688,15 +2072,17 @@ class SchemaInterpreter:
         pos = 0
         fields = self._resolve_fields(fPort)
         
-        for field_def in fields:
+        for kind, field_def, name in self._decode_plan(fields):
+            # Padding: consecutive skip fields pre-merged into one advance
+            if kind == 'skip':
+                pos += name
+                continue
+            
             # Handle $ref - inline the referenced definition
-            if '$ref' in field_def:
+            if kind == 'ref':
                 try:
-                    ref_def = self._resolve_ref(field_def['$ref'])
-                    ref_fields = ref_def.get('fields', [])
-                    for rf in ref_fields:
-                        rf_name = rf.get('name', 'unknown')
-                        if not rf_name.startswith('_'):
+                    for rf_name, internal, rf in self._resolve_ref_fields(field_def['$ref']):
+                        if not internal:
                             value, pos = self._decode_field(rf, payload, pos)
                             value = self._apply_modifiers(value, rf)
                             if value is not None:
@@ -1708,12 +2094,12 @@ class SchemaInterpreter:
                 continue
             
             # Handle byte_group construct
-            if 'byte_group' in field_def:
+            if kind == 'byte_group':
                 pos = self._decode_byte_group(field_def, payload, pos, result)
                 continue
             
             # Option B: match: as top-level key
-            if 'match' in field_def and not field_def.get('type'):
+            if kind == 'match':
                 try:
                     match_result, pos = self._decode_match(field_def, payload, pos)
                     result.data.update(match_result)
@@ -1722,7 +2108,7 @@ class SchemaInterpreter:
                 continue
             
             # Option B: object: as top-level key
-            if 'object' in field_def and not field_def.get('type'):
+            if kind == 'object':
                 try:
                     obj_name = field_def['object']
                     nested_fields = field_def.get('fields', [])
@@ -1755,7 +2141,7 @@ class SchemaInterpreter:
                 continue
             
             # Option B: tlv: as top-level key
-            if 'tlv' in field_def and not field_def.get('type'):
+            if kind == 'tlv':
                 try:
                     tlv_result, pos = self._decode_tlv(field_def, payload, pos)
                     result.data.update(tlv_result)
@@ -1764,7 +2150,7 @@ class SchemaInterpreter:
                 continue
             
             # Phase 2: flagged: construct (bitmask field presence)
-            if 'flagged' in field_def and not field_def.get('type'):
+            if kind == 'flagged':
                 try:
                     flagged_def = field_def['flagged']
                     flagged_result, pos = self._decode_flagged(flagged_def, payload, pos)
@@ -1783,11 +2169,8 @@ class SchemaInterpreter:
                     result.errors.append(f"Error in flagged: {e}")
                 continue
             
-            name = field_def.get('name', 'unknown')
-            field_type = field_def.get('type', 'u8')
-            
             # Phase 2: bitfield_string type
-            if field_type == 'bitfield_string':
+            if kind == 'bitfield_string':
                 try:
                     value, pos = self._decode_bitfield_string(field_def, payload, pos)
                     result.data[name] = value
@@ -1797,7 +2180,7 @@ class SchemaInterpreter:
                 continue
             
             # Computed field (type: number) - supports formula, ref, polynomial, compute, guard
-            if field_type == 'number':
+            if kind == 'number':
                 try:
                     value = self._decode_computed_field(field_def)
                     if value is not None:
@@ -1812,7 +2195,7 @@ class SchemaInterpreter:
                 continue
             
             # Handle match at field level (legacy: no name, type: match)
-            if field_type == 'match' and name == 'unknown':
+            if kind == 'match_legacy':
                 try:
                     match_result, pos = self._decode_match(field_def, payload, pos)
                     result.data.update(match_result)
@@ -1821,7 +2204,7 @@ class SchemaInterpreter:
                 continue
             
             # Skip internal fields
-            if name.startswith('_'):
+            if kind == 'internal':
                 try:
                     _, pos = self._decode_field(field_def, payload, pos)
                 except Exception as e:
@@ -1864,13 +2247,91 @@ class SchemaInterpreter:
         
         return result
     
+    def decode_many(self, payloads: Union[List[bytes], bytes], fPort: int = None,
+                    record_size: int = None) -> List[DecodeResult]:
+        """
+        Decode a batch of payloads that share this schema.
+        
+        Args:
+            payloads: List of payloads, or one concatenated buffer when
+                record_size is given
+            fPort: LoRaWAN fPort (for port-based schema selection)
+            record_size: Split a concatenated buffer into records of this size
+            
+        Returns:
+            List of DecodeResult, one per payload
+        """
+        if record_size is not None:
+            if record_size <= 0:
+                raise ValueError(f"record_size must be positive, got {record_size}")
+            buf = memoryview(payloads)
+            payloads = [buf[i:i + record_size] for i in range(0, len(buf), record_size)]
+        
+        layout = self._batch_layout(self._resolve_fields(fPort))
+        if layout is None:
+            return [self.decode(p, fPort) for p in payloads]
+        
+        record, steps = layout
+        size = record.size
+        apply_modifiers = self._apply_modifiers
+        results = []
+        for payload in payloads:
+            if len(payload) < size:
+                # Short payload: let decode() report the truncation
+                results.append(self.decode(payload, fPort))
+                continue
+            try:
+                data = {}
+                for (name, field_def), value in zip(steps, record.unpack_from(payload)):
+                    if name is not None:
+                        data[name] = apply_modifiers(value, field_def)
+            except Exception:
+                results.append(self.decode(payload, fPort))
+                continue
+            results.append(DecodeResult(data=data, bytes_consumed=size))
+        return results
+    
+    def _batch_layout(self, fields: List[Dict[str, Any]]) -> Optional[Tuple[struct.Struct, tuple]]:
+        """
+        Compile a field list into one record Struct for decode_many, or None.
+        
+        Applies when the decode plan is only fixed-width numeric fields
+        (no encoding, formula or valid_range) and skip padding. Returns
+        (record, steps) with one (name, field_def) step per unpacked value;
+        internal fields have name None. Computed once per field list and endian.
+        """
+        plan = self._decode_plan(fields)
+        if not plan:
+            return None
+        entry = self._batch_layouts.get(id(fields))
+        if entry is not None and entry[0] is fields and entry[1] == self.endian:
+            return entry[2]
+        
+        codes = ['<' if self.endian == Endian.LITTLE else '>']
+        steps = []
+        for kind, field_def, name in plan:
+            if kind == 'skip':
+                codes.append(f'{name}x')
+                continue
+            field_type = field_def.get('type', 'u8')
+            if (kind not in ('field', 'internal') or field_type not in STRUCT_CODES
+                    or field_def.get('encoding')
+                    or (kind == 'field' and (field_def.get('formula') or field_def.get('valid_range')))):
+                steps = None
+                break
+            codes.append(STRUCT_CODES[field_type])
+            steps.append((name if kind == 'field' else None, field_def))
+        
+        layout = (struct.Struct(''.join(codes)), tuple(steps)) if steps is not None else None
+        self._batch_layouts[id(fields)] = (fields, self.endian, layout)
+        return layout
+    
     def _resolve_metadata_ref(self, ref: str, input_meta: Dict[str, Any]) -> Any:
         """Resolve a $ metadata reference against TS013 input."""
         if not isinstance(ref, str) or not ref.startswith('$'):
             return None
         path = ref[1:]  # Remove $
-        import re as _re
-        path = _re.sub(r'\[(\d+)\]', r'.\1', path)
+        path = re.sub(r'\[(\d+)\]', r'.\1', path)
         parts = path.split('.')
         current = input_meta
         for part in parts:
@@ -1969,11 +2430,16 @@ class SchemaInterpreter:
         Returns:
             EncodeResult with encoded payload
         """
+        fields = self._resolve_fields(fPort)
+        
+        # Fixed-layout schemas pack straight into a preallocated buffer
+        layout = self._encode_layout(fields)
+        if layout is not None:
+            return self._encode_fixed(fields, layout, data)
+        
         result = EncodeResult(payload=b'')
         output = bytearray()
         
-        fields = self._resolve_fields(fPort)
-        
         # Pre-scan for flagged constructs to compute flags values
         flags_patches = {}
         for field_def in fields:
@@ -2047,6 +2513,82 @@ class SchemaInterpreter:
         result.payload = bytes(output)
         return result
     
+    def _encode_layout(self, fields: List[Dict[str, Any]]) -> Optional[Tuple[int, tuple]]:
+        """
+        Compute the fixed encode layout of a field list, or None.
+        
+        Applies when every field is a fixed-width numeric type (no special
+        encoding) or fixed-length skip padding. Returns (total_size, steps)
+        where each step is a (struct.Struct, converter) pair, or
+        (None, length) for padding. Computed once per field list and endian.
+        """
+        if not fields:
+            return None
+        entry = self._encode_layouts.get(id(fields))
+        if entry is not None and entry[0] is fields and entry[1] == self.endian:
+            return entry[2]
+        
+        prefix = '<' if self.endian == Endian.LITTLE else '>'
+        total_size = 0
+        steps = []
+        for field_def in fields:
+            if 'flagged' in field_def:
+                steps = None
+                break
+            field_type = field_def.get('type', 'u8')
+            if field_type == 'skip' and isinstance(field_def.get('length', 1), int):
+                length = field_def.get('length', 1)
+                steps.append((None, length))
+                total_size += length
+            elif field_type in STRUCT_CODES and not field_def.get('encoding'):
+                packer = struct.Struct(prefix + STRUCT_CODES[field_type])
+                convert = int if field_type in INT_TYPES else float
+                steps.append((packer, convert))
+                total_size += packer.size
+            else:
+                steps = None
+                break
+        
+        layout = (total_size, tuple(steps)) if steps is not None else None
+        self._encode_layouts[id(fields)] = (fields, self.endian, layout)
+        return layout
+    
+    def _encode_fixed(self, fields: List[Dict[str, Any]], layout: Tuple[int, tuple],
+                      data: Dict[str, Any]) -> EncodeResult:
+        """Encode a fixed-layout field list with pack_into on one preallocated buffer."""
+        result = EncodeResult(payload=b'')
+        total_size, steps = layout
+        output = bytearray(total_size)
+        pos = 0
+        
+        for field_def, (packer, arg) in zip(fields, steps):
+            # Skip type: buffer is already zero-filled
+            if packer is None:
+                pos += arg
+                continue
+            
+            name = field_def.get('name', 'unknown')
+            # Internal fields - use default or 0
+            if name.startswith('_'):
+                value = field_def.get('default', 0)
+            else:
+                value = data.get(name)
+                if value is None:
+                    result.warnings.append(f"Missing field: {name}")
+                    value = 0
+            
+            try:
+                value = self._reverse_modifiers(value, field_def)
+                packer.pack_into(output, pos, arg(value))
+                pos += packer.size
+            except Exception as e:
+                # Drop the field's slot, matching the variable-layout path
+                del output[pos:pos + packer.size]
+                result.errors.append(f"Error encoding {name}: {e}")
+        
+        result.payload = bytes(output)
+        return result
+    
     def _encode_flagged(self, flagged_def: Dict[str, Any], data: Dict[str, Any]) -> bytes:
         """Encode flagged groups: only encode groups where data is present."""
         groups = flagged_def.get('groups', [])
@@ -2135,14 +2677,8 @@ class SchemaInterpreter:
                 pass
         
         # Reverse modifiers in reverse YAML key order with inverse operations
-        mod_keys = [k for k in field_def if k in ('add', 'mult', 'div')]
-        for key in reversed(mod_keys):
-            if key == 'add' and field_def['add'] is not None:
-                value = value - field_def['add']
-            elif key == 'div' and field_def['div'] is not None and field_def['div'] != 0:
-                value = value * field_def['div']
-            elif key == 'mult' and field_def['mult'] is not None and field_def['mult'] != 0:
-                value = value / field_def['mult']
+        for op, operand in self._modifier_plan(field_def)[1]:
+            value = op(value, operand)
         
         # Float types should preserve fractional values
         field_type = field_def.get('type', 'u8')
@@ -2159,24 +2695,8 @@ class SchemaInterpreter:
         if any(c in str(field_type) for c in ['[', ':', '<']):
             return bytes([int(value) & 0xFF])
         
-        # Type info with all aliases (must match decoder)
-        type_info = {
-            # Unsigned (canonical: u prefix)
-            'u8': (1, False), 'uint8': (1, False),
-            'u16': (2, False), 'uint16': (2, False),
-            'u24': (3, False), 'uint24': (3, False),
-            'u32': (4, False), 'uint32': (4, False),
-            'u64': (8, False), 'uint64': (8, False),
-            # Signed (canonical: s prefix, aliases: i prefix, int prefix)
-            's8': (1, True), 'i8': (1, True), 'int8': (1, True),
-            's16': (2, True), 'i16': (2, True), 'int16': (2, True),
-            's24': (3, True), 'i24': (3, True), 'int24': (3, True),
-            's32': (4, True), 'i32': (4, True), 'int32': (4, True),
-            's64': (8, True), 'i64': (8, True), 'int64': (8, True),
-        }
-        
-        if field_type in type_info:
-            size, signed = type_info[field_type]
+        if field_type in INT_TYPES:
+            size, signed = INT_TYPES[field_type]
             int_val = int(value)
             # Apply encoding if specified (sign_magnitude, bcd, gray)
             encoding = field_def.get('encoding')
@@ -2221,9 +2741,8 @@ class SchemaInterpreter:
             return bytes.fromhex(str(value).replace(' ', ''))[:length].ljust(length, b'\x00')
         
         if field_type == 'base64':
-            import base64 as b64
             length = field_def.get('length', 0)
-            decoded = b64.b64decode(str(value))
+            decoded = base64.b64decode(str(value))
             if length:
                 return decoded[:length].ljust(length, b'\x00')
             return decoded
@@ -2332,6 +2851,7 @@ class SchemaInterpreter:
             DecodeResult with decoded data including '_command' name
         """
         result = DecodeResult(data={}, bytes_consumed=0)
+        payload = memoryview(payload)
         
         if len(payload) < 1:
             result.errors.append("Payload too short for command_id")
@@ -99,3 +99,72 @@ message Output {
     assert output_file.exists()
     content = output_file.read_text()
     assert "Output" in content
+
+
+def test_deeply_nested_messages(tmp_path):
+    """Messages embedding the same submessage many times are sized quickly."""
+    lines = ['syntax = "proto3";', 'message M0 {', '    uint32 id = 1;', '}']
+    for i in range(1, 40):
+        lines.extend([
+            f'message M{i} {{',
+            f'    M{i - 1} left = 1;',
+            f'    M{i - 1} right = 2;',
+            '}',
+        ])
+    proto_file = tmp_path / "nested.proto"
+    proto_file.write_text('\n'.join(lines))
+    
+    result = subprocess.run(
+        [sys.executable, str(TOOL_PATH), str(proto_file)],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0
+    assert "`M39`" in result.stdout
+
+
+def test_recursive_message(tmp_path):
+    """Self-referencing and mutually recursive messages are sized without recursing forever."""
+    proto_file = tmp_path / "recursive.proto"
+    proto_file.write_text("""
+syntax = "proto3";
+message Node {
+    uint32 value = 1;
+    repeated Node children = 2;
+    Tree tree = 3;
+}
+message Tree {
+    Node root = 1;
+}
+""")
+    
+    result = subprocess.run(
+        [sys.executable, str(TOOL_PATH), str(proto_file)],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "`Node`" in result.stdout
+    assert "`Tree`" in result.stdout
+
+
+def test_long_token_in_message_body(tmp_path):
+    """A very long word in a comment does not stall field matching."""
+    proto_file = tmp_path / "long.proto"
+    proto_file.write_text(
+        'syntax = "proto3";\n'
+        'message Blob {\n'
+        '    // ' + 'A' * 50000 + '\n'
+        '    uint32 id = 1;\n'
+        '}\n'
+    )
+    
+    result = subprocess.run(
+        [sys.executable, str(TOOL_PATH), str(proto_file), "--json"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    assert result.returncode == 0
+    assert '"field_count": 1' in result.stdout
@@ -0,0 +1,112 @@
+"""Tests for analyze_ttn_codec.py"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).parent.parent
+TOOL_PATH = TOOLS_DIR / "analyze_ttn_codec.py"
+
+
+def run_tool(tmp_path, js_code, mode):
+    """Analyze a codec source and return the tool's stdout for mode."""
+    codec_file = tmp_path / "codec.js"
+    codec_file.write_text(js_code)
+    result = subprocess.run(
+        [sys.executable, str(TOOL_PATH), str(codec_file), mode],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"Failed: {result.stderr}"
+    return result.stdout
+
+
+def run_json(tmp_path, js_code):
+    """Analyze a codec source and return the --json output."""
+    return json.loads(run_tool(tmp_path, js_code, "--json"))
+
+
+def test_analyze_simple_codec(tmp_path):
+    """Test field extraction from a simple codec."""
+    data = run_json(tmp_path, """
+function decodeUplink(input) {
+  var bytes = input.bytes;
+  var decoded = {};
+  decoded.temperature = ((bytes[0] << 8) | bytes[1]) / 10;
+  decoded.battery = bytes[2] & 0x7F;
+  return { data: decoded };
+}
+""")
+    fields = {f['name']: f for f in data['fields']}
+    assert fields['temperature']['byte_indices'] == [0, 1]
+    assert fields['temperature']['size'] == 2
+    assert fields['temperature']['multiplier'] == 0.1
+    assert fields['battery']['bit_mask'] == 0x7F
+    assert fields['battery']['confidence'] == 'high'
+
+
+def test_condition_keywords_are_whole_words(tmp_path):
+    """Test that identifiers containing if/case/else don't mark a condition."""
+    data = run_json(tmp_path, """
+function decodeUplink(input) {
+  var bytes = input.bytes;
+  var decoded = {};
+  notify(bytes);
+  var elsewhere = 1;
+  decoded.level = bytes[0];
+  if (bytes[1] > 0) {
+    decoded.alarm = bytes[1];
+  }
+  return { data: decoded };
+}
+""")
+    fields = {f['name']: f for f in data['fields']}
+    assert fields['level']['confidence'] == 'high'
+    assert fields['level']['condition'] is None
+    assert fields['alarm']['confidence'] == 'medium'
+    assert fields['alarm']['condition'] == 'bytes[1] > 0'
+
+
+def test_tlv_marker_in_switch_or_if_header(tmp_path):
+    """Test TLV markers inside switch/if headers are still detected."""
+    data = run_json(tmp_path, """
+function Decoder(bytes, port) {
+  var decoded = {};
+  switch (channel_type) {
+    case 1: decoded.temp = bytes[1] / 10; break;
+  }
+  return decoded;
+}
+""")
+    assert data['is_tlv'] is True
+    assert data['conditionals'][0]['variable'] == 'channel_type'
+    
+    data = run_json(tmp_path, """
+function Decoder(bytes, port) {
+  var decoded = {};
+  if (channel_id === 1 && bytes[0] > 2) {
+    decoded.temp = bytes[1] / 10;
+  }
+  return decoded;
+}
+""")
+    assert data['is_tlv'] is True
+    assert data['conditionals'][0]['type'] == 'if'
+
+
+def test_wide_bitfield_mask(tmp_path):
+    """Test a mask wider than one byte gets a note and a wide enough base."""
+    js_code = """
+function decodeUplink(input) {
+  var bytes = input.bytes;
+  var decoded = {};
+  decoded.level = (((bytes[0] << 8) | bytes[1]) >> 2) & 0x3FF;
+  return { data: decoded };
+}
+"""
+    data = run_json(tmp_path, js_code)
+    assert "Mask 0x3FF = 10 bits" in data['fields'][0]['notes']
+    
+    draft = run_tool(tmp_path, js_code, "--yaml")
+    assert "  - name: level\n    type: u16[2:11]\n" in draft